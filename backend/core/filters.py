@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, fields, replace
+from functools import lru_cache
+from itertools import compress, repeat
+from operator import and_, eq, ge, le
+from typing import Callable, Iterable, Optional, Sequence
+
+UNKNOWN_PARTY = "Independent / Unknown"
+
+# ---------- Categorical bucket definitions ----------
+CASES_BUCKETS = {"0": (0, 0), "1-5": (1, 5), "6+": (6, None)}
+AGE_BUCKETS = {"under35": (None, 34), "35-44": (35, 44), "45-54": (45, 54), "55+": (55, None)}
+ASSETS_BUCKETS = {
+    "under10l": (None, 999999),
+    "10l-1cr": (1000000, 9999999),
+    "1cr-10cr": (10000000, 99999999),
+    "10cr+": (100000000, None),
+}
+
+
+@dataclass(frozen=True)
+class CandidateFilters:
+    """Filter values shared by the party dashboard and party detail pages."""
+
+    cases: str = ""
+    age_group: str = ""
+    assets_range: str = ""
+    sitting_mla: str = ""
+    district: str = ""
+    constituency: str = ""
+    party: str = ""
+
+    @classmethod
+    def from_query(cls, params) -> CandidateFilters:
+        # Every field is read from the query parameter of the same name.
+        return cls(*[params.get(name, "").strip() for name in FILTER_PARAMS])
+
+    def normalized(self) -> CandidateFilters:
+        """Return these filters with values no filter recognizes blanked.
+
+        Such values select the same rows as no filter, so the filtered row
+        caches are keyed on the normalized filters, while the page keeps the
+        values from the query for its selected options and links.
+        """
+        unrecognized = {}
+        for name, choices in FILTER_CHOICES.items():
+            value = getattr(self, name)
+            if value and value not in choices:
+                unrecognized[name] = ""
+        return replace(self, **unrecognized) if unrecognized else self
+
+
+# CandidateFilters fields in declaration order, which are also the query parameter names.
+FILTER_PARAMS = tuple(field.name for field in fields(CandidateFilters))
+
+
+def _closed_bounds(buckets: dict) -> dict[str, tuple]:
+    # Open bucket ends become infinities so a range check is always two comparisons.
+    return {
+        key: (float("-inf") if low is None else low, float("inf") if high is None else high)
+        for key, (low, high) in buckets.items()
+    }
+
+
+# (CandidateFilters attribute, dataset column, closed bounds per bucket value)
+RANGE_FILTERS = (
+    ("cases", "criminal_cases", _closed_bounds(CASES_BUCKETS)),
+    ("age_group", "age", _closed_bounds(AGE_BUCKETS)),
+    ("assets_range", "total_assets", _closed_bounds(ASSETS_BUCKETS)),
+)
+SITTING_VALUES = {"0": 0, "1": 1}
+# The accepted values of the fields that take a fixed set of choices.
+FILTER_CHOICES = {
+    "cases": CASES_BUCKETS,
+    "age_group": AGE_BUCKETS,
+    "assets_range": ASSETS_BUCKETS,
+    "sitting_mla": SITTING_VALUES,
+}
+
+
+def _equal_to(target) -> Callable:
+    def select(indices: Sequence[int], values: Iterable) -> list[int]:
+        return list(compress(indices, map(eq, repeat(target), values)))
+
+    return select
+
+
+def _member_of(accepted: frozenset) -> Callable:
+    def select(indices: Sequence[int], values: Iterable) -> list[int]:
+        return list(compress(indices, map(accepted.__contains__, values)))
+
+    return select
+
+
+def _within(low, high) -> Callable:
+    # Missing numbers are NaN in the dataset columns and fail both bounds.
+    def select(indices: Sequence[int], values: Iterable) -> list[int]:
+        values = list(values)
+        return list(compress(indices, map(and_, map(le, repeat(low), values), map(ge, repeat(high), values))))
+
+    return select
+
+
+# Columns whose filters match whole values, so the dataset can index their row
+# positions by value and a filter can start from those positions directly.
+INDEXED_COLUMNS = ("party", "district", "constituency", "sitting")
+
+
+def range_value_indices(columns: dict[str, Sequence], row_count: int) -> dict[str, dict[tuple, tuple[int, ...]]]:
+    """Return the row positions inside every bucket of each range filter.
+
+    Keyed by column, then by the bucket's closed bounds, so the range filters
+    can seed ``select_candidate_indices`` just like the ``INDEXED_COLUMNS``.
+    """
+    every_row = range(row_count)
+    return {
+        column: {
+            bounds: tuple(_within(*bounds)(every_row, columns[column])) for bounds in bounds_by_bucket.values()
+        }
+        for _attribute, column, bounds_by_bucket in RANGE_FILTERS
+    }
+
+
+@lru_cache(maxsize=256)
+def active_predicates(filters: CandidateFilters, has_sitting: bool) -> tuple[tuple[str, object, Callable], ...]:
+    """Return ``(column, argument, select)`` for each active filter, equality checks first.
+
+    Each ``select`` is specialized to its filter kind and bound value, and the
+    tuple is memoized per filter set, so a request only runs the checks its
+    filters need. Every selector is a map/compress pipeline, keeping the
+    per-row work in C. The equality checks come first because they are the most
+    selective and the range checks then only see the rows that survived them.
+    The argument is the frozenset of accepted keys into the column's
+    ``value_indices``: values for the ``INDEXED_COLUMNS``, bounds for ranges.
+    """
+    predicates: list[tuple[str, object, Callable]] = []
+    if filters.party:
+        accepted = frozenset({filters.party, ""} if filters.party == UNKNOWN_PARTY else {filters.party})
+        predicates.append(("party", accepted, _member_of(accepted)))
+    if filters.constituency:
+        predicates.append(("constituency", frozenset({filters.constituency}), _equal_to(filters.constituency)))
+    if filters.district:
+        predicates.append(("district", frozenset({filters.district}), _equal_to(filters.district)))
+    sitting = SITTING_VALUES.get(filters.sitting_mla) if has_sitting else None
+    if sitting is not None:
+        predicates.append(("sitting", frozenset({sitting}), _equal_to(sitting)))
+    for attribute, column, bounds_by_bucket in RANGE_FILTERS:
+        bounds = bounds_by_bucket.get(getattr(filters, attribute))
+        if bounds:
+            predicates.append((column, frozenset({bounds}), _within(*bounds)))
+    return tuple(predicates)
+
+
+def select_candidate_indices(
+    row_count: int,
+    columns: dict[str, Sequence],
+    filters: CandidateFilters,
+    has_sitting: bool,
+    value_indices: Optional[dict[str, dict[object, Sequence[int]]]] = None,
+) -> Sequence[int]:
+    """Return the ascending positions of the rows passing every active filter.
+
+    Each predicate scans its own column, but only at the row indices that
+    passed the previous predicates. With ``value_indices`` (row positions per
+    value of each indexed column and per bucket of each range filter), the most
+    selective filter seeds the indices from its posting list instead of
+    scanning the whole column, and the other predicates then check only those rows.
+    """
+    indices: Sequence[int] = range(row_count)
+    predicates = active_predicates(filters, has_sitting)
+    if predicates and value_indices:
+        seeds = [
+            (sum(len(positions.get(value, ())) for value in accepted), position, positions, accepted)
+            for position, (name, accepted, _select) in enumerate(predicates)
+            if (positions := value_indices.get(name)) is not None
+        ]
+        if seeds:
+            _size, position, positions, accepted = min(seeds)
+            indices = sorted(index for value in accepted for index in positions.get(value, ()))
+            predicates = predicates[:position] + predicates[position + 1 :]
+    for name, _argument, select in predicates:
+        if not indices:
+            return []
+        indices = select(indices, map(columns[name].__getitem__, indices))
+    return indices
+
@@ -31,23 +31,53 @@ def _parse_int(value: str | None) -> int | None:
         return None
 
 
-def _get_first(row: dict, keys: Iterable[str]) -> str | None:
-    for key in keys:
-        value = row.get(key)
+# Accepted header spellings per field, in order of preference.
+NAME_HEADERS = ("Candidate Name", "Name", "candidate_name")
+CONSTITUENCY_HEADERS = ("Constituency", "AC Name", "constituency")
+PARTY_HEADERS = ("Party", "Party Name", "party")
+STATUS_HEADERS = ("Status", "Candidate Status", "status")
+CRIMINAL_CASES_HEADERS = ("Criminal Cases", "criminal_cases")
+SERIOUS_CASES_HEADERS = ("Serious Criminal Cases", "serious_cases")
+ASSETS_HEADERS = ("Total Assets", "assets_total")
+LIABILITIES_HEADERS = ("Total Liabilities", "liabilities_total")
+EDUCATION_HEADERS = ("Education", "education")
+
+
+def _column_indices(header: list[str], keys: Iterable[str]) -> tuple[int, ...]:
+    # A repeated header name resolves to its last column, as with csv.DictReader.
+    positions = {name: index for index, name in enumerate(header)}
+    return tuple(positions[key] for key in keys if key in positions)
+
+
+def _get_first(row: list[str], columns: tuple[int, ...]) -> str | None:
+    for column in columns:
+        value = row[column] if column < len(row) else None
         if value:
-            return str(value).strip()
+            return value.strip()
     return None
 
 
 def load_affidavit_csv(path: str | Path) -> list[AffidavitRecord]:
     records: list[AffidavitRecord] = []
     with open(path, newline="", encoding="utf-8") as handle:
-        reader = csv.DictReader(handle)
+        # The header aliases are resolved to column indices once per file, so
+        # each row is a plain list rather than a csv.DictReader dict.
+        reader = csv.reader(handle)
+        header = next(reader, [])
+        name_columns = _column_indices(header, NAME_HEADERS)
+        constituency_columns = _column_indices(header, CONSTITUENCY_HEADERS)
+        party_columns = _column_indices(header, PARTY_HEADERS)
+        status_columns = _column_indices(header, STATUS_HEADERS)
+        criminal_cases_columns = _column_indices(header, CRIMINAL_CASES_HEADERS)
+        serious_cases_columns = _column_indices(header, SERIOUS_CASES_HEADERS)
+        assets_columns = _column_indices(header, ASSETS_HEADERS)
+        liabilities_columns = _column_indices(header, LIABILITIES_HEADERS)
+        education_columns = _column_indices(header, EDUCATION_HEADERS)
         for row in reader:
-            name = _get_first(row, ["Candidate Name", "Name", "candidate_name"])
-            constituency = _get_first(row, ["Constituency", "AC Name", "constituency"])
-            party = _get_first(row, ["Party", "Party Name", "party"])
-            status = _get_first(row, ["Status", "Candidate Status", "status"]) or "unknown"
+            name = _get_first(row, name_columns)
+            constituency = _get_first(row, constituency_columns)
+            party = _get_first(row, party_columns)
+            status = _get_first(row, status_columns) or "unknown"
             if not name or not constituency:
                 continue
 
@@ -56,11 +86,11 @@ def load_affidavit_csv(path: str | Path) -> list[AffidavitRecord]:
                 constituency=constituency,
                 party=party or "Independent",
                 status=status,
-                criminal_cases=_parse_int(_get_first(row, ["Criminal Cases", "criminal_cases"])),
-                serious_cases=_parse_int(_get_first(row, ["Serious Criminal Cases", "serious_cases"])),
-                assets_total=_parse_int(_get_first(row, ["Total Assets", "assets_total"])),
-                liabilities_total=_parse_int(_get_first(row, ["Total Liabilities", "liabilities_total"])),
-                education=_get_first(row, ["Education", "education"]) or "",
+                criminal_cases=_parse_int(_get_first(row, criminal_cases_columns)),
+                serious_cases=_parse_int(_get_first(row, serious_cases_columns)),
+                assets_total=_parse_int(_get_first(row, assets_columns)),
+                liabilities_total=_parse_int(_get_first(row, liabilities_columns)),
+                education=_get_first(row, education_columns) or "",
             )
             records.append(record)
     return records
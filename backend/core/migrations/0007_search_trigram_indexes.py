@@ -0,0 +1,45 @@
+from django.db import migrations
+
+# Django compiles `field__icontains=q` on PostgreSQL to
+# `UPPER("field"::text) LIKE UPPER('%q%')`, so the trigram indexes are built on
+# that exact expression for the planner to use them for the search page.
+SEARCH_INDEXES = (
+    ("core_constituency_name_trgm", "core_constituency", "name"),
+    ("core_constituency_name_ta_trgm", "core_constituency", "name_ta"),
+    ("core_constituency_district_trgm", "core_constituency", "district"),
+    ("core_constituency_district_ta_trgm", "core_constituency", "district_ta"),
+    ("core_candidate_name_trgm", "core_candidate", "name"),
+    ("core_candidate_name_ta_trgm", "core_candidate", "name_ta"),
+    ("core_party_name_trgm", "core_party", "name"),
+    ("core_party_name_ta_trgm", "core_party", "name_ta"),
+)
+
+
+def create_trigram_indexes(apps, schema_editor):
+    # SQLite (local development) has no pg_trgm; its LIKE scans are fine there.
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for index_name, table, column in SEARCH_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS "{index_name}" ON "{table}" '
+            f'USING gin ((UPPER("{column}"::text)) gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for index_name, _table, _column in SEARCH_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS "{index_name}"')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0006_constituency_agricultural_workers_pct_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
@@ -0,0 +1,27 @@
+import json
+
+from django.db import migrations, models
+
+
+def populate_boundary_geojson_text(apps, schema_editor):
+    Constituency = apps.get_model("core", "Constituency")
+    constituencies = Constituency.objects.exclude(boundary_geojson__isnull=True).only("id", "boundary_geojson")
+    for constituency in constituencies.iterator():
+        constituency.boundary_geojson_text = json.dumps(constituency.boundary_geojson, separators=(",", ":"))
+        constituency.save(update_fields=["boundary_geojson_text"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0007_search_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='constituency',
+            name='boundary_geojson_text',
+            field=models.TextField(blank=True, editable=False),
+        ),
+        migrations.RunPython(populate_boundary_geojson_text, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,37 @@
+from django.db import migrations
+
+# The API viewsets' SearchFilter also compiles to `UPPER("field"::text) LIKE
+# UPPER('%q%')`. Every searched column except party abbreviation is already
+# covered by 0007_search_trigram_indexes.
+SEARCH_INDEXES = (
+    ("core_party_abbreviation_trgm", "core_party", "abbreviation"),
+)
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for index_name, table, column in SEARCH_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS "{index_name}" ON "{table}" '
+            f'USING gin ((UPPER("{column}"::text)) gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for index_name, _table, _column in SEARCH_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS "{index_name}"')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0008_constituency_boundary_geojson_text'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
@@ -0,0 +1,67 @@
+from django.db import migrations, models
+
+
+def _bounds(geometry):
+    if not isinstance(geometry, dict) or "coordinates" not in geometry:
+        return None
+    lats, lngs = [], []
+    stack = [geometry["coordinates"]]
+    while stack:
+        item = stack.pop()
+        if not isinstance(item, list):
+            continue
+        if len(item) >= 2 and isinstance(item[0], (int, float)) and isinstance(item[1], (int, float)):
+            lngs.append(item[0])
+            lats.append(item[1])
+        else:
+            stack.extend(item)
+    if not lats:
+        return None
+    return min(lats), min(lngs), max(lats), max(lngs)
+
+
+def populate_bbox(apps, schema_editor):
+    Constituency = apps.get_model("core", "Constituency")
+    constituencies = Constituency.objects.exclude(boundary_geojson__isnull=True).only("id", "boundary_geojson")
+    for constituency in constituencies.iterator():
+        bounds = _bounds(constituency.boundary_geojson)
+        if bounds is None:
+            continue
+        (
+            constituency.bbox_min_lat,
+            constituency.bbox_min_lng,
+            constituency.bbox_max_lat,
+            constituency.bbox_max_lng,
+        ) = bounds
+        constituency.save(update_fields=["bbox_min_lat", "bbox_min_lng", "bbox_max_lat", "bbox_max_lng"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0009_api_search_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='constituency',
+            name='bbox_min_lat',
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='constituency',
+            name='bbox_min_lng',
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='constituency',
+            name='bbox_max_lat',
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='constituency',
+            name='bbox_max_lng',
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.RunPython(populate_bbox, migrations.RunPython.noop),
+    ]
@@ -1,9 +1,40 @@
 from __future__ import annotations
 
+import json
+
 from django.db import models
 from django.db.models import Q
 
 
+def serialize_geojson(geometry) -> str:
+    if geometry is None:
+        return ""
+    return json.dumps(geometry, separators=(",", ":"))
+
+
+def geojson_bounds(geometry) -> tuple[float, float, float, float] | None:
+    """Return ``(min_lat, min_lng, max_lat, max_lng)`` of a GeoJSON geometry, or None."""
+    if not isinstance(geometry, dict) or "coordinates" not in geometry:
+        return None
+    lats: list[float] = []
+    lngs: list[float] = []
+    # Walk the nested coordinate arrays with an explicit stack; positions are
+    # the innermost [lng, lat, ...] lists.
+    stack = [geometry["coordinates"]]
+    while stack:
+        item = stack.pop()
+        if not isinstance(item, list):
+            continue
+        if len(item) >= 2 and isinstance(item[0], (int, float)) and isinstance(item[1], (int, float)):
+            lngs.append(item[0])
+            lats.append(item[1])
+        else:
+            stack.extend(item)
+    if not lats:
+        return None
+    return min(lats), min(lngs), max(lats), max(lngs)
+
+
 class SourceDocument(models.Model):
     class SourceType(models.TextChoices):
         OFFICIAL = "official", "Official"
@@ -35,6 +66,10 @@ class Election(models.Model):
         return f"{self.name} ({self.year})"
 
 
+# Constituency fields computed from boundary_geojson in Constituency.save().
+GEOJSON_DERIVED_FIELDS = ("boundary_geojson_text", "bbox_min_lat", "bbox_min_lng", "bbox_max_lat", "bbox_max_lng")
+
+
 class Constituency(models.Model):
     name = models.CharField(max_length=255, unique=True)
     name_ta = models.CharField(max_length=255, blank=True)
@@ -44,6 +79,14 @@ class Constituency(models.Model):
     reservation_category = models.CharField(max_length=50, blank=True)
     reservation_category_ta = models.CharField(max_length=50, blank=True)
     boundary_geojson = models.JSONField(null=True, blank=True)
+    # Compact JSON text of boundary_geojson, kept in sync on save so the map
+    # endpoint can inline geometries without re-encoding them.
+    boundary_geojson_text = models.TextField(blank=True, editable=False)
+    # Bounding box of boundary_geojson, kept in sync on save for map search.
+    bbox_min_lat = models.FloatField(null=True, blank=True, editable=False)
+    bbox_min_lng = models.FloatField(null=True, blank=True, editable=False)
+    bbox_max_lat = models.FloatField(null=True, blank=True, editable=False)
+    bbox_max_lng = models.FloatField(null=True, blank=True, editable=False)
     last_updated = models.DateTimeField(auto_now=True)
 
     # Geography
@@ -94,6 +137,19 @@ class Constituency(models.Model):
     def __str__(self) -> str:
         return self.name
 
+    def save(self, *args, **kwargs):
+        self.boundary_geojson_text = serialize_geojson(self.boundary_geojson)
+        (
+            self.bbox_min_lat,
+            self.bbox_min_lng,
+            self.bbox_max_lat,
+            self.bbox_max_lng,
+        ) = geojson_bounds(self.boundary_geojson) or (None, None, None, None)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "boundary_geojson" in update_fields:
+            kwargs["update_fields"] = {*update_fields, *GEOJSON_DERIVED_FIELDS}
+        super().save(*args, **kwargs)
+
 
 class Party(models.Model):
     name = models.CharField(max_length=255, unique=True)
@@ -1,9 +1,15 @@
+import re
 from decimal import Decimal, InvalidOperation
 
 from django import template
 
 register = template.Library()
 
+# Matches each digit followed by an odd run of three or more digits, i.e. the
+# lakh/crore grouping positions: 1234567 -> 12,34,567. Shared with the
+# number formatting in views so both group digits the same way.
+INDIAN_GROUP_RE = re.compile(r"(\d)(?=(?:\d\d)+\d$)")
+
 
 def _format_indian_number(value) -> str:
     if value is None:
@@ -27,14 +33,7 @@ def _format_indian_number(value) -> str:
     decimal_part = number - integer_part
     integer_text = str(integer_part)
 
-    if len(integer_text) > 3:
-        last_three = integer_text[-3:]
-        rest = integer_text[:-3]
-        grouped = []
-        while rest:
-            grouped.insert(0, rest[-2:])
-            rest = rest[:-2]
-        integer_text = ",".join(grouped + [last_three])
+    integer_text = INDIAN_GROUP_RE.sub(r"\1,", integer_text)
 
     if decimal_part:
         decimal_text = f"{decimal_part:.2f}".split(".")[1].rstrip("0")
@@ -1,4 +1,4 @@
-from django.urls import path, include
+from django.urls import path
 from rest_framework.routers import DefaultRouter
 
 from . import views
@@ -24,5 +24,8 @@ urlpatterns = [
     path("constituency/<int:constituency_id>/", views.constituency_detail, name="constituency-detail"),
     path("candidate/<int:candidate_id>/", views.candidate_detail, name="candidate-detail"),
     path("feedback/", views.submit_feedback, name="feedback"),
-    path("", include(router.urls)),
 ]
+
+# Mount the API routes directly instead of behind an include() so API
+# requests skip one resolver hop.
+urlpatterns += router.urls
@@ -1,30 +1,45 @@
 import csv
+import hashlib
+import heapq
 import json
-import difflib
+import math
 import re
+import sys
 from collections import Counter, defaultdict
+from dataclasses import dataclass, field, replace
 from functools import lru_cache
+from itertools import chain
+from operator import attrgetter, itemgetter
 from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from typing import Callable, Iterable, Mapping, Optional, Sequence
 from urllib.parse import urlencode
 
 from django.conf import settings
-from django.db.models import Prefetch, Q
-from django.http import JsonResponse
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Case, Count, Exists, F, IntegerField, Max, OuterRef, Prefetch, Q, TextField, Value, When
+from django.db.models.functions import Coalesce, NullIf
+from django.http import HttpResponse, JsonResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import reverse
+from rapidfuzz import fuzz, process
 from rest_framework import viewsets, filters
 
+from django.views.decorators.cache import cache_control
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_POST
 
+from .filters import INDEXED_COLUMNS, CandidateFilters, range_value_indices, select_candidate_indices
 from .models import (
+    Affidavit,
     Candidate,
     CandidateResult,
     CoalitionMembership,
     Constituency,
     Election,
     Feedback,
+    LegalCase,
     Manifesto,
     ManifestoPromise,
     Party,
@@ -32,15 +47,14 @@ from .models import (
     PromiseAssessment,
 )
 from .serializers import CandidateSerializer, ConstituencySerializer, ManifestoSerializer, PartySerializer
-from .templatetags.indian_numbers import short_indian
+from .templatetags.indian_numbers import INDIAN_GROUP_RE, short_indian
 
 
 def home(request):
     # Load 2021 candidate data for overview stats
     data_dir = settings.BASE_DIR.parent / "data"
     csv_path = data_dir / "fct_candidates_21.csv"
-    rows = _load_party_rows(str(csv_path))
-    stats = _compute_overview_stats(rows)
+    stats = _dataset_overview_stats(_load_dataset(str(csv_path)))
 
     return render(request, "core/home.html", {
         "total_parties": stats["total_parties"],
@@ -121,29 +135,193 @@ def map_view(request):
     return render(request, "core/map.html")
 
 
-@lru_cache(maxsize=1)
-def _load_smla_rows() -> list[dict]:
-    csv_path = settings.BASE_DIR.parent / "data" / "fct_candidates_21.csv"
-    if not csv_path.exists():
-        return []
-    with csv_path.open("r", encoding="utf-8") as handle:
-        reader = csv.DictReader(handle)
-        return list(reader)
+@dataclass(frozen=True, slots=True)
+class CandidateRow:
+    values: tuple[str, ...]
+    column: dict[str, int] = field(compare=False, repr=False)
+    candidate: str
+    party: str
+    education: str
+    district: str
+    constituency: str
+    constituency_key: str
+    district_key: str
+    official_key: str
+    official_name: str
+    myneta_url: str
+    criminal_cases: Optional[int]
+    age: Optional[int]
+    total_assets: Optional[int]
+    liabilities: Optional[int]
+    sitting: Optional[int]
+    is_2016: bool
+
+    def get(self, key: str, default: str = "") -> str:
+        """Return the party detail table's display value for a CSV column.
+
+        Lets templates read rows directly through the ``get_item`` filter.
+        ``values`` already holds the display form (see ``_candidate_row``).
+        """
+        index = self.column.get(key)
+        return default if index is None else self.values[index]
+
+
+# CSV columns read into CandidateRow, in the order _candidate_row unpacks them.
+ROW_FIELDS = (
+    "candidate",
+    "party",
+    "education",
+    "2021_district",
+    "district",
+    "2021_constituency",
+    "constituency",
+    "const_off",
+    "myneta_url",
+    "criminal_cases",
+    "age",
+    "total_assets_rs",
+    "liabilities_rs",
+    "sitting_MLA",
+)
+
+
+def _row_fields_getter(column: dict[str, int], width: int) -> Callable[[tuple[str, ...]], tuple[str, ...]]:
+    """Return an itemgetter yielding ROW_FIELDS from a row padded to ``width + 1``.
+
+    Columns absent from the header read index ``width``, which holds "".
+    """
+    return itemgetter(*(column.get(name, width) for name in ROW_FIELDS))
+
+
+def _candidate_row(
+    values: tuple[str, ...],
+    column: dict[str, int],
+    get_fields: Callable[[tuple[str, ...]], tuple[str, ...]],
+    category: Callable[[str], str],
+    normalize: Callable[[Optional[str]], str],
+    parse_count: Callable[[str], Optional[int]],
+    title_case: Callable[[str], str],
+    district_positions: tuple[int, ...],
+    constituency_position: Optional[int],
+) -> CandidateRow:
+    (
+        candidate,
+        party,
+        education,
+        district_2021,
+        district,
+        constituency_2021,
+        constituency,
+        const_off,
+        myneta_url,
+        criminal_cases,
+        age,
+        total_assets,
+        liabilities,
+        sitting,
+    ) = map(str.strip, get_fields(values))
+    # The party detail table shows districts title-cased and the constituency
+    # under its official name, so the cells are stored in that form once here.
+    display = list(values)
+    for position in district_positions:
+        if display[position]:
+            display[position] = title_case(display[position])
+    if constituency_position is not None and const_off:
+        display[constituency_position] = const_off
+    return CandidateRow(
+        values=tuple(display),
+        column=column,
+        candidate=candidate,
+        party=category(party),
+        education=category(education),
+        district=category(district_2021 or district),
+        constituency=category(constituency_2021 or constituency),
+        constituency_key=normalize(constituency_2021),
+        district_key=normalize(district_2021),
+        official_key=normalize(const_off),
+        official_name=const_off,
+        myneta_url=myneta_url,
+        criminal_cases=parse_count(criminal_cases),
+        age=parse_count(age),
+        total_assets=_parse_int(total_assets),
+        liabilities=_parse_int(liabilities),
+        sitting=parse_count(sitting),
+        is_2016=_is_2016_candidate(candidate, constituency_2021 or constituency),
+    )
+
+
+# Row attributes also stored column-wise on CandidateDataset, so the dashboard
+# filters can scan one tuple per active filter instead of every row object.
+# Missing numbers are stored as NaN, for which every comparison is false, so
+# range checks need no separate None test.
+NUMERIC_DATASET_COLUMNS = ("criminal_cases", "age", "total_assets", "liabilities", "sitting")
+DATASET_COLUMNS = NUMERIC_DATASET_COLUMNS + (
+    "party", "district", "constituency", "education", "constituency_key", "district_key", "official_key"
+)
+
+
+# Compared by identity: each parse of a CSV yields a new dataset, which lets
+# per-dataset results be memoized with lru_cache.
+@dataclass(frozen=True, slots=True, eq=False)
+class CandidateDataset:
+    header: tuple[str, ...]
+    rows: tuple[CandidateRow, ...]
+    by_constituency: dict[str, tuple[CandidateRow, ...]]
+    official_by_key: dict[str, str]
+    columns: dict[str, tuple]
+    value_indices: dict[str, dict[object, tuple[int, ...]]]
+
+
+EMPTY_DATASET = CandidateDataset(
+    header=(),
+    rows=(),
+    by_constituency={},
+    official_by_key={},
+    columns={name: () for name in DATASET_COLUMNS},
+    value_indices={},
+)
+
+
+# Shared read-only fallback for lookups into the cached alias tables.
+EMPTY_MAPPING: Mapping = MappingProxyType({})
+
+SMLA_CSV_PATH = str(settings.BASE_DIR.parent / "data" / "fct_candidates_21.csv")
+
+
+def _load_smla_dataset() -> CandidateDataset:
+    return _load_dataset(SMLA_CSV_PATH)
+
+
+_BYE_ELECTION_RE = re.compile(r"\s*:\s*BYE ELECTION.*$")
+_NON_ALNUM_RE = re.compile(r"[^A-Z0-9]+")
+_NON_ALNUM_TABLE = str.maketrans({
+    code: " " for code in range(128) if not ("A" <= chr(code) <= "Z" or "0" <= chr(code) <= "9")
+})
 
 
 def _normalize_constituency_name(name: Optional[str]) -> str:
     raw = (name or "").strip().upper()
-    raw = re.sub(r"\s*:\s*BYE ELECTION.*$", "", raw)
-    normalized = re.sub(r"[^A-Z0-9]+", " ", raw)
-    return re.sub(r"\s+", " ", normalized).strip()
+    if "BYE ELECTION" in raw:
+        raw = _BYE_ELECTION_RE.sub("", raw)
+    if raw.isascii():
+        # One C-level table pass blanks everything but A-Z/0-9; split() then
+        # collapses the runs of spaces.
+        return " ".join(raw.translate(_NON_ALNUM_TABLE).split())
+    # Whitespace is non-alphanumeric too, so this one pass also collapses it.
+    return _NON_ALNUM_RE.sub(" ", raw).strip()
 
 
-def _is_2016_row(row: dict) -> bool:
-    candidate_name = (row.get("candidate") or "").strip().lower()
-    constituency_name = _normalize_constituency_name(
-        row.get("2021_constituency") or row.get("constituency")
-    )
-    return candidate_name == "ambethkumar s" and constituency_name == "VANDAVASI SC"
+# The one 2021 CSV row that carries a 2016 candidacy.
+_2016_CANDIDATE = "ambethkumar s"
+_2016_CONSTITUENCY_KEY = "VANDAVASI SC"
+
+
+def _is_2016_candidate(candidate: str, constituency: str) -> bool:
+    # Evaluated once per row at CSV load and stored as CandidateRow.is_2016.
+    # The cheap name check rules out almost every row before any normalizing.
+    if candidate.lower() != _2016_CANDIDATE:
+        return False
+    return _normalize_constituency_name(constituency) == _2016_CONSTITUENCY_KEY
 
 
 @lru_cache(maxsize=1)
@@ -156,79 +334,90 @@ def _load_party_symbol_map() -> dict[str, str]:
     except json.JSONDecodeError:
         return {}
 
-@lru_cache(maxsize=1)
-def _load_official_constituencies() -> dict[str, str]:
-    csv_path = settings.BASE_DIR.parent / "data" / "fct_candidates_21.csv"
-    if not csv_path.exists():
-        return {}
-    with csv_path.open("r", encoding="utf-8") as handle:
-        reader = csv.DictReader(handle)
-        mapping: dict[str, str] = {}
-        for row in reader:
-            raw = (row.get("2021_constituency") or "").strip()
-            official = (row.get("const_off") or "").strip()
-            key = _normalize_constituency_name(raw)
-            if key and official and key not in mapping:
-                mapping[key] = official
-        return mapping
-
-
-def _match_constituency_key(key: str, candidates: set[str], cutoff: float = 0.9) -> str:
+# Candidate pools up to this size are scored directly; the length prefilter
+# only pays off on the statewide pool.
+SMALL_CANDIDATE_POOL = 8
+
+
+@lru_cache(maxsize=256)
+def _fuzzy_choices(candidates: frozenset[str]) -> tuple[tuple[str, ...], tuple[int, ...]]:
+    """Return the candidates in a stable order and their lengths, once per candidate set.
+
+    The order is descending because extractOne keeps the first of equally
+    scored names, and difflib.get_close_matches, which this replaced, kept the
+    alphabetically largest: "TIRUCHIRAPPALLI" resolves to its WEST seat.
+    """
+    ordered = tuple(sorted(candidates, reverse=True))
+    return ordered, tuple(map(len, ordered))
+
+
+def _match_constituency_key(key: str, candidates: frozenset[str], cutoff: float = 0.9) -> str:
     if key in candidates:
         return key
-    for suffix in (" SC", " ST"):
-        if key.endswith(suffix):
-            trimmed = key[: -len(suffix)].strip()
-            if trimmed in candidates:
-                return trimmed
-        else:
-            expanded = f"{key}{suffix}"
+    # Reserved seats differ only by a trailing " SC"/" ST"; strip it when
+    # present, otherwise try adding either one.
+    if key.endswith((" SC", " ST")):
+        trimmed = key[:-3].strip()
+        if trimmed in candidates:
+            return trimmed
+    else:
+        for expanded in (key + " SC", key + " ST"):
             if expanded in candidates:
                 return expanded
-    matches = difflib.get_close_matches(key, candidates, n=1, cutoff=cutoff)
-    return matches[0] if matches else key
+    score_cutoff = cutoff * 100
+    names, lengths = _fuzzy_choices(candidates)
+    if len(names) <= SMALL_CANDIDATE_POOL:
+        choices = names
+    else:
+        # fuzz.ratio is 100 * (1 - distance / total_length) and the edit distance
+        # is at least the length difference, so skip candidates that cannot
+        # reach the cutoff before scoring them.
+        key_length = len(key)
+        choices = [
+            name
+            for name, length in zip(names, lengths)
+            if 100 * (1 - abs(length - key_length) / (length + key_length)) >= score_cutoff
+        ]
+    if not choices:
+        return key
+    match = process.extractOne(key, choices, scorer=fuzz.ratio, score_cutoff=score_cutoff)
+    return match[0] if match else key
 
 
 def _resolve_constituency_key(
     raw_key: str,
     district_key: str,
-    constituency_seen: set[str],
-    district_candidates: dict[str, set[str]],
-    alias_by_district: dict[str, dict[str, str]],
+    constituency_seen: frozenset[str],
+    district_candidates: Mapping[str, frozenset[str]],
+    alias_by_district: Mapping[str, Mapping[str, str]],
     cutoff: float = 0.85,
 ) -> str:
-    if district_key and district_key in alias_by_district:
-        mapped = alias_by_district[district_key].get(raw_key)
+    if district_key:
+        mapped = alias_by_district.get(district_key, EMPTY_MAPPING).get(raw_key)
         if mapped:
             return mapped
-    if raw_key in alias_by_district.get("", {}):
-        mapped = alias_by_district[""].get(raw_key)
-        if mapped:
-            return mapped
-    if district_key and district_key in district_candidates:
-        return _match_constituency_key(raw_key, district_candidates[district_key], cutoff=cutoff)
+    mapped = alias_by_district.get("", EMPTY_MAPPING).get(raw_key)
+    if mapped:
+        return mapped
+    candidates = district_candidates.get(district_key) if district_key else None
+    if candidates is not None:
+        return _match_constituency_key(raw_key, candidates, cutoff=cutoff)
     return _match_constituency_key(raw_key, constituency_seen, cutoff=cutoff)
 
 
+@lru_cache(maxsize=4096, typed=True)
 def _format_indian_number(value: Optional[float]) -> str:
     if value is None:
         return "N/A"
     if isinstance(value, float):
         value = round(value, 2) if value % 1 else int(value)
-    text = str(abs(int(value))) if isinstance(value, int) or float(value).is_integer() else str(value)
+    text = str(abs(int(value))) if isinstance(value, int) or float(value).is_integer() else str(abs(value))
     negative = str(value).startswith("-")
     if "." in text:
         integer_part, decimal_part = text.split(".", 1)
     else:
         integer_part, decimal_part = text, ""
-    if len(integer_part) > 3:
-        last_three = integer_part[-3:]
-        rest = integer_part[:-3]
-        groups = []
-        while rest:
-            groups.insert(0, rest[-2:])
-            rest = rest[:-2]
-        integer_part = ",".join(groups + [last_three])
+    integer_part = INDIAN_GROUP_RE.sub(r"\1,", integer_part)
     formatted = integer_part
     if decimal_part:
         decimal_part = decimal_part.rstrip("0")
@@ -331,139 +520,283 @@ LOCAL_PARTY_SYMBOLS = {
 }
 
 
+_PARTY_SYMBOL_URLS = {key: f"/static/core/party-symbols/{filename}" for key, filename in LOCAL_PARTY_SYMBOLS.items()}
+
+
+# Both helpers see the same few hundred party spellings over and over, so the
+# stripped/lowercased lookups are memoized per raw name.
+@lru_cache(maxsize=1024)
 def _party_color(party_name: Optional[str]) -> Optional[str]:
     if not party_name:
         return None
     return PARTY_COLORS.get(party_name.strip())
 
 
+@lru_cache(maxsize=1024)
 def _party_symbol_url(party_name: Optional[str]) -> Optional[str]:
     if not party_name:
         return None
-    key = party_name.strip().lower()
-    filename = LOCAL_PARTY_SYMBOLS.get(key)
-    if filename:
-        return f"/static/core/party-symbols/{filename}"
-    return None
+    return _PARTY_SYMBOL_URLS.get(party_name.strip().lower())
+
+
+# JSON endpoints below do not depend on the session language, so browsers and
+# proxies may cache them. HTML detail pages are rendered per session language
+# and stay uncached by them; see PARTY_DETAIL_CACHE_SECONDS for the one page
+# cached server-side.
+JSON_CACHE_SECONDS = 60 * 60
+
 
+def _boundary_version() -> tuple[int, float]:
+    """Return the count and latest update time of the constituencies with boundaries."""
+    version = Constituency.objects.exclude(boundary_geojson__isnull=True).aggregate(
+        count=Count("id"),
+        last_updated=Max("last_updated"),
+    )
+    last_updated = version["last_updated"].timestamp() if version["last_updated"] else 0
+    return version["count"], last_updated
+
+
+def _map_data_cache_key() -> str:
+    """Version the cached map payload by the CSV file and the boundary rows.
+
+    The key is derived from data every process can see, so a re-import through
+    a management command invalidates the cache of the running web workers too.
+    """
+    try:
+        csv_mtime = Path(SMLA_CSV_PATH).stat().st_mtime_ns
+    except FileNotFoundError:
+        csv_mtime = 0
+    count, last_updated = _boundary_version()
+    return f"core:map_data:{csv_mtime}:{count}:{last_updated}"
 
+
+@cache_control(public=True, max_age=JSON_CACHE_SECONDS)
 def map_data(request):
-    rows = _load_smla_rows()
-    sitting_lookup: dict[str, dict] = {}
+    cache_key = _map_data_cache_key()
+    body = cache.get(cache_key)
+    if body is None:
+        # Cache the encoded bytes so HttpResponse does not re-encode the
+        # multi-megabyte string on every hit.
+        body = _build_map_data().encode("utf-8")
+        cache.set(cache_key, body, None)
+    return HttpResponse(body, content_type="application/json")
+
+
+# Explicit spelling aliases for map/CSV mismatches.
+EXPLICIT_CONSTITUENCY_ALIASES = {
+    "PALACODU": "PALACODE",
+    "THALLI": "THALLY",
+    "SHOZHINGANALLUR": "SHOLINGANALLUR",
+    "VANDAVASI": "VANDAVASI SC",
+    "VANDAVASI SC": "VANDAVASI SC",
+}
+MAP_DISTRICT_ALIASES = {
+    "TIRUVANNAMALAI": {"VANDAVASI SC": "VANDAVASI SC", "VANDAVASI": "VANDAVASI SC"},
+    "TIRUPATHUR": {"TIRUPPATTUR": "TIRUPATTUR"},
+    "SIVAGANGA": {"TIRUPPATTUR": "TIRUPPATHUR"},
+}
+DETAIL_DISTRICT_ALIASES = {
+    "TIRUVANNAMALAI": {"VANDAVASI SC": "VANDAVASI SC", "VANDAVASI": "VANDAVASI SC"},
+    "VILUPPURAM": {"VANDAVASI SC": "VANDAVASI SC", "VANDAVASI": "VANDAVASI SC"},
+    "TIRUPATHUR": {"TIRUPPATTUR": "TIRUPATTUR"},
+    "VELLORE": {"TIRUPPATTUR": "TIRUPATTUR"},
+    "SIVAGANGA": {"TIRUPPATTUR": "TIRUPPATHUR"},
+}
+
+
+@lru_cache(maxsize=4)
+def _csv_constituency_aliases(
+    dataset: CandidateDataset,
+) -> tuple[frozenset[str], Mapping[str, frozenset[str]], Mapping[str, Mapping[str, str]]]:
+    """Return the CSV keys, per-district candidates and spelling aliases for matching DB constituencies.
+
+    Built in one pass over the rows per dataset; the map and the constituency
+    page then overlay their own district aliases on the shared result.
+    """
     constituency_seen: set[str] = set()
-    official_lookup = _load_official_constituencies()
-    district_lookup: dict[str, str] = {}
-    district_candidates: dict[str, set[str]] = defaultdict(set)
-    alias_by_district: dict[str, dict[str, str]] = defaultdict(dict)
-    for row in rows:
-        constituency_key = _normalize_constituency_name(row.get("2021_constituency"))
-        district_key = _normalize_constituency_name(row.get("2021_district"))
-        if constituency_key:
-            constituency_seen.add(constituency_key)
-            if district_key:
-                district_candidates[district_key].add(constituency_key)
-                district_lookup.setdefault(constituency_key, (row.get("2021_district") or "").strip())
-            official_key = _normalize_constituency_name(row.get("const_off"))
-            if official_key:
-                alias_by_district[district_key][official_key] = constituency_key
-                alias_by_district[""].setdefault(official_key, constituency_key)
-        if str(row.get("sitting_MLA", "")).strip() != "1":
+    district_candidates: dict[str, set[str]] = {}
+    alias_by_district: dict[str, dict[str, str]] = {"": {}}
+    global_aliases = alias_by_district[""]
+    for constituency_key, district_key, official_key in zip(
+        dataset.columns["constituency_key"], dataset.columns["district_key"], dataset.columns["official_key"]
+    ):
+        if not constituency_key:
             continue
-        party_name = (row.get("party") or "").strip()
-        sitting_lookup[constituency_key] = {
-            "party": party_name,
-            "party_color": _party_color(party_name),
-        }
+        constituency_seen.add(constituency_key)
+        if district_key:
+            district_candidates.setdefault(district_key, set()).add(constituency_key)
+        if official_key:
+            alias_by_district.setdefault(district_key, {})[official_key] = constituency_key
+            global_aliases.setdefault(official_key, constituency_key)
+
+    for raw, mapped in EXPLICIT_CONSTITUENCY_ALIASES.items():
+        global_aliases.setdefault(raw, mapped)
+        for district_key in district_candidates:
+            alias_by_district.setdefault(district_key, {}).setdefault(raw, mapped)
+    return (
+        frozenset(constituency_seen),
+        MappingProxyType({district_key: frozenset(keys) for district_key, keys in district_candidates.items()}),
+        MappingProxyType(
+            {district_key: MappingProxyType(aliases) for district_key, aliases in alias_by_district.items()}
+        ),
+    )
 
-    # Explicit spelling aliases for map/CSV mismatches.
-    explicit_aliases = {
-        "PALACODU": "PALACODE",
-        "THALLI": "THALLY",
-        "SHOZHINGANALLUR": "SHOLINGANALLUR",
-        "VANDAVASI": "VANDAVASI SC",
-        "VANDAVASI SC": "VANDAVASI SC",
-    }
-    for raw, mapped in explicit_aliases.items():
-        alias_by_district[""].setdefault(raw, mapped)
-        for district_key in district_candidates.keys():
-            alias_by_district[district_key].setdefault(raw, mapped)
-    explicit_district_aliases = {
-        "TIRUVANNAMALAI": {"VANDAVASI SC": "VANDAVASI SC", "VANDAVASI": "VANDAVASI SC"},
-        "TIRUPATHUR": {"TIRUPPATTUR": "TIRUPATTUR"},
-        "SIVAGANGA": {"TIRUPPATTUR": "TIRUPPATHUR"},
-    }
-    for district_key, mapping in explicit_district_aliases.items():
-        for raw, mapped in mapping.items():
-            alias_by_district[district_key].setdefault(raw, mapped)
-
-    features = []
-    for constituency in Constituency.objects.exclude(boundary_geojson__isnull=True):
-        raw_key = _normalize_constituency_name(constituency.name)
-        district_key = _normalize_constituency_name(constituency.district)
-        constituency_key = _resolve_constituency_key(
-            raw_key,
-            district_key,
-            constituency_seen,
-            district_candidates,
-            alias_by_district,
-            cutoff=0.85,
-        )
-        lookup = sitting_lookup.get(constituency_key, {})
-        is_vacant = constituency_key in constituency_seen and not lookup
-        is_unknown = constituency_key not in constituency_seen
-        official_name = official_lookup.get(constituency_key) or official_lookup.get(raw_key) or constituency.name
-        display_district = constituency.district or district_lookup.get(constituency_key, "")
-        features.append(
-            {
-                "type": "Feature",
-                "properties": {
-                    "id": constituency.id,
-                    "name": official_name,
-                    "district": display_district,
-                    "party": lookup.get("party", ""),
-                    "party_color": lookup.get("party_color"),
-                    "vacant": is_vacant,
-                    "unknown": is_unknown,
-                },
-                "geometry": constituency.boundary_geojson,
-            }
-        )
-    legend = [
-        {"party": party, "color": color}
-        for party, color in sorted(
-            {(value["party"], value["party_color"]) for value in sitting_lookup.values() if value.get("party")},
-            key=lambda item: item[0],
-        )
-        if color
-    ]
-    return JsonResponse({"type": "FeatureCollection", "features": features, "legend": legend})
 
+def _constituency_aliases(
+    dataset: CandidateDataset,
+    district_aliases: dict[str, dict[str, str]],
+    global_overrides: Optional[dict[str, str]] = None,
+) -> tuple[frozenset[str], Mapping[str, frozenset[str]], Mapping[str, Mapping[str, str]]]:
+    constituency_seen, district_candidates, csv_aliases = _csv_constituency_aliases(dataset)
+    # Only the districts being overlaid get new dicts; the rest are shared.
+    alias_by_district = dict(csv_aliases)
+    for district_key, mapping in district_aliases.items():
+        alias_by_district[district_key] = MappingProxyType({**mapping, **alias_by_district.get(district_key, {})})
+    if global_overrides:
+        alias_by_district[""] = MappingProxyType({**alias_by_district[""], **global_overrides})
+    return constituency_seen, district_candidates, MappingProxyType(alias_by_district)
+
+
+@lru_cache(maxsize=4)
+def _map_constituency_aliases(
+    dataset: CandidateDataset,
+) -> tuple[frozenset[str], Mapping[str, frozenset[str]], Mapping[str, Mapping[str, str]]]:
+    return _constituency_aliases(dataset, MAP_DISTRICT_ALIASES)
+
+
+@lru_cache(maxsize=4)
+def _detail_constituency_aliases(
+    dataset: CandidateDataset,
+) -> tuple[frozenset[str], Mapping[str, frozenset[str]], Mapping[str, Mapping[str, str]]]:
+    # Force correct global alias for Tirupathur (overrides any auto-generated alias)
+    # GeoJSON has "Tiruppattur" -> normalized "TIRUPPATTUR", CSV has "TIRUPATTUR"
+    return _constituency_aliases(dataset, DETAIL_DISTRICT_ALIASES, {"TIRUPPATTUR": "TIRUPATTUR"})
 
-def _calculate_bounds(boundary_geojson):
-    """Extract bounding box from GeoJSON geometry."""
-    if not boundary_geojson:
-        return None
-    try:
-        coords = []
-        
-        def extract_coords(obj):
-            if isinstance(obj, list):
-                if len(obj) >= 2 and isinstance(obj[0], (int, float)) and isinstance(obj[1], (int, float)):
-                    coords.append((obj[1], obj[0]))  # lat, lng
-                else:
-                    for item in obj:
-                        extract_coords(item)
-        
-        if "coordinates" in boundary_geojson:
-            extract_coords(boundary_geojson["coordinates"])
-        
-        if coords:
-            lats = [c[0] for c in coords]
-            lngs = [c[1] for c in coords]
-            return [[min(lats), min(lngs)], [max(lats), max(lngs)]]
-    except (KeyError, TypeError, ValueError):
-        pass
-    return None
+
+@lru_cache(maxsize=1024)
+def _map_constituency_key(dataset: CandidateDataset, name: str, district: str) -> str:
+    """Resolve a boundary's DB name and district to its CSV constituency key.
+
+    Keyed by the values being matched rather than the row id, so a renamed
+    constituency is simply resolved again and nothing has to be invalidated.
+    """
+    constituency_seen, district_candidates, alias_by_district = _map_constituency_aliases(dataset)
+    return _resolve_constituency_key(
+        _normalize_constituency_name(name),
+        _normalize_constituency_name(district),
+        constituency_seen,
+        district_candidates,
+        alias_by_district,
+        cutoff=0.85,
+    )
+
+
+@lru_cache(maxsize=1024)
+def _detail_constituency_key(dataset: CandidateDataset, name: str, district: str) -> str:
+    """Resolve a constituency page's DB name and district to its CSV constituency key."""
+    constituency_seen, district_candidates, alias_by_district = _detail_constituency_aliases(dataset)
+    return _resolve_constituency_key(
+        _normalize_constituency_name(name),
+        _normalize_constituency_name(district),
+        constituency_seen,
+        district_candidates,
+        alias_by_district,
+        cutoff=0.85,
+    )
+
+
+_MISSING = object()
+# json.dumps builds a new encoder whenever it gets non-default options; the map
+# payload encodes one properties object per feature, so reuse a single one.
+_encode_compact_json = json.JSONEncoder(separators=(",", ":")).encode
+
+
+@dataclass(frozen=True, slots=True)
+class SittingIndex:
+    # Constituency key -> sitting MLA's party entry, or None when the seat is
+    # in the CSV but has no sitting MLA (vacant).
+    party_by_key: Mapping[str, Optional[dict]]
+    district_by_key: Mapping[str, str]
+    # (party, color) of every colored sitting party, sorted by party name.
+    legend: tuple[tuple[str, str], ...]
+
+
+@lru_cache(maxsize=4)
+def _sitting_index(dataset: CandidateDataset) -> SittingIndex:
+    """Return each CSV constituency's sitting MLA party and district, once per dataset."""
+    party_by_key: dict[str, Optional[dict]] = {}
+    district_by_key: dict[str, str] = {}
+    for row in dataset.rows:
+        constituency_key = row.constituency_key
+        if constituency_key:
+            if row.sitting == 1:
+                party_name = row.party
+                party_by_key[constituency_key] = {"party": party_name, "party_color": _party_color(party_name)}
+            else:
+                party_by_key.setdefault(constituency_key, None)
+            if row.district_key:
+                district_by_key.setdefault(constituency_key, row.district)
+    # One pass over the seats the map shows; a party's color is fixed, so the
+    # first one seen is the party's legend entry.
+    legend_colors: dict[str, str] = {}
+    for entry in party_by_key.values():
+        if entry and entry["party"] and entry["party_color"]:
+            legend_colors.setdefault(entry["party"], entry["party_color"])
+    return SittingIndex(
+        party_by_key=MappingProxyType(party_by_key),
+        district_by_key=MappingProxyType(district_by_key),
+        legend=tuple(sorted(legend_colors.items())),
+    )
+
+
+def _build_map_data() -> str:
+    dataset = _load_smla_dataset()
+    sitting_index = _sitting_index(dataset)
+    smla_index = sitting_index.party_by_key
+    official_lookup = dataset.official_by_key
+    district_lookup = sitting_index.district_by_key
+
+    parts: list[str] = []
+    # Stream the geometry text in chunks rather than holding every boundary
+    # row in the queryset cache at once.
+    constituencies = Constituency.objects.exclude(boundary_geojson__isnull=True).values(
+        "id", "name", "district", "boundary_geojson_text"
+    )
+    for constituency in constituencies.iterator(chunk_size=200):
+        raw_key = _normalize_constituency_name(constituency["name"])
+        constituency_key = _map_constituency_key(dataset, constituency["name"], constituency["district"])
+        entry = smla_index.get(constituency_key, _MISSING)
+        is_unknown = entry is _MISSING
+        is_vacant = entry is None
+        # Unknown and vacant seats carry no party; _MISSING itself is truthy.
+        lookup = entry if isinstance(entry, dict) else {}
+        official_name = official_lookup.get(constituency_key) or official_lookup.get(raw_key) or constituency["name"]
+        display_district = constituency["district"] or district_lookup.get(constituency_key, "")
+        properties = {
+            "id": constituency["id"],
+            "name": official_name,
+            "district": display_district,
+            "party": lookup.get("party", ""),
+            "party_color": lookup.get("party_color"),
+            "vacant": is_vacant,
+            "unknown": is_unknown,
+        }
+        # Geometries are inlined from their stored JSON text rather than being
+        # decoded into Python objects only to be encoded again. The pieces are
+        # joined once at the end, so no geometry string is copied per feature.
+        if parts:
+            parts.append(",")
+        parts += (
+            '{"type":"Feature","properties":',
+            _encode_compact_json(properties),
+            ',"geometry":',
+            constituency["boundary_geojson_text"] or "null",
+            "}",
+        )
+    legend = [{"party": party, "color": color} for party, color in sitting_index.legend]
+    return "".join(
+        ('{"type":"FeatureCollection","features":[', *parts, '],"legend":', _encode_compact_json(legend), "}")
+    )
 
 
 def _fuzzy_match_score(query: str, target: str, threshold: float = 0.6) -> float:
@@ -494,8 +827,9 @@ def _fuzzy_match_score(query: str, target: str, threshold: float = 0.6) -> float
     if target in query:
         return 0.8
     
-    # Use difflib for fuzzy matching
-    ratio = difflib.SequenceMatcher(None, query, target).ratio()
+    # Normalized Indel similarity; with a score cutoff rapidfuzz skips pairs
+    # whose lengths already rule out the threshold and returns 0 for them.
+    ratio = fuzz.ratio(query, target, score_cutoff=threshold * 100) / 100
     
     # Also check if words match
     query_words = set(query.split())
@@ -506,6 +840,103 @@ def _fuzzy_match_score(query: str, target: str, threshold: float = 0.6) -> float
     return ratio if ratio >= threshold else 0.0
 
 
+@dataclass(frozen=True, slots=True)
+class SearchConstituency:
+    id: int
+    name: str
+    name_ta: str
+    district: str
+    district_ta: str
+    name_lower: str
+    name_normalized: str
+    name_ta_lower: str
+    district_lower: str
+    district_ta_lower: str
+    bounds: Optional[list]
+
+
+@dataclass(frozen=True, slots=True)
+class SearchDistrict:
+    district: str
+    district_lower: str
+    district_ta: str
+    district_ta_lower: str
+    constituency_count: int
+    bounds: Optional[list]
+
+
+@dataclass(frozen=True, slots=True)
+class MapSearchIndex:
+    constituencies: tuple[SearchConstituency, ...]
+    districts: tuple[SearchDistrict, ...]
+
+
+@lru_cache(maxsize=2)
+def _map_search_index(version: tuple[int, float]) -> MapSearchIndex:
+    """Pre-lowercase the searchable names and compute bounds once per boundary version.
+
+    ``version`` is only the cache key; a re-import changes it and the index is rebuilt.
+    """
+    constituencies = []
+    by_district: dict[str, list[SearchConstituency]] = {}
+    # Bounds come from the bbox columns stored on save, so the geometries
+    # themselves are never loaded here.
+    rows = Constituency.objects.exclude(boundary_geojson__isnull=True).values(
+        "id", "name", "name_ta", "district", "district_ta", "bbox_min_lat", "bbox_min_lng", "bbox_max_lat", "bbox_max_lng"
+    )
+    for row in rows:
+        name = row["name"] or ""
+        name_ta = row["name_ta"] or ""
+        district = (row["district"] or "").strip()
+        district_ta = row["district_ta"] or ""
+        constituency = SearchConstituency(
+            id=row["id"],
+            name=row["name"],
+            name_ta=name_ta,
+            district=district,
+            district_ta=district_ta,
+            name_lower=name.lower(),
+            name_normalized=_normalize_constituency_name(name),
+            name_ta_lower=name_ta.lower(),
+            district_lower=district.lower(),
+            district_ta_lower=district_ta.lower(),
+            bounds=(
+                [[row["bbox_min_lat"], row["bbox_min_lng"]], [row["bbox_max_lat"], row["bbox_max_lng"]]]
+                if row["bbox_min_lat"] is not None
+                else None
+            ),
+        )
+        constituencies.append(constituency)
+        if district:
+            by_district.setdefault(district, []).append(constituency)
+
+    districts = []
+    for district, members in by_district.items():
+        # The Tamil district name comes from the district's first constituency.
+        district_ta = members[0].district_ta
+        all_bounds = [member.bounds for member in members if member.bounds]
+        if all_bounds:
+            min_lat = min(b[0][0] for b in all_bounds)
+            min_lng = min(b[0][1] for b in all_bounds)
+            max_lat = max(b[1][0] for b in all_bounds)
+            max_lng = max(b[1][1] for b in all_bounds)
+            combined_bounds = [[min_lat, min_lng], [max_lat, max_lng]]
+        else:
+            combined_bounds = None
+        districts.append(
+            SearchDistrict(
+                district=district,
+                district_lower=district.lower(),
+                district_ta=district_ta,
+                district_ta_lower=district_ta.lower(),
+                constituency_count=len(members),
+                bounds=combined_bounds,
+            )
+        )
+    return MapSearchIndex(constituencies=tuple(constituencies), districts=tuple(districts))
+
+
+@cache_control(public=True, max_age=JSON_CACHE_SECONDS)
 def map_search(request):
     """Return constituencies matching search query for map autocomplete with fuzzy matching."""
     query = request.GET.get("q", "").strip()
@@ -515,135 +946,87 @@ def map_search(request):
     query_lower = query.lower()
     query_normalized = _normalize_constituency_name(query)
     
-    constituencies = Constituency.objects.exclude(boundary_geojson__isnull=True)
-    
-    # Build list of all searchable items with scores
-    scored_results = []
+    search_index = _map_search_index(_boundary_version())
     
-    # Track districts for district-level results
-    district_constituencies: dict[str, list] = {}
+    # Priority: higher score first, then name matches, then district matches
+    type_priority = {"name": 0, "district_group": 1, "district": 2}
     
-    for constituency in constituencies:
-        # Score against constituency name
-        name_score = max(
-            _fuzzy_match_score(query_lower, (constituency.name or "").lower()),
-            _fuzzy_match_score(query_normalized, _normalize_constituency_name(constituency.name)),
-        )
-        
-        # Score against Tamil name
-        name_ta_score = _fuzzy_match_score(query_lower, (constituency.name_ta or "").lower())
-        
-        # Score against district
-        district = (constituency.district or "").strip()
-        district_score = _fuzzy_match_score(query_lower, district.lower())
-        district_ta_score = _fuzzy_match_score(query_lower, (constituency.district_ta or "").lower())
-        
-        # Best score for this constituency
-        best_score = max(name_score, name_ta_score, district_score, district_ta_score)
-        
-        if best_score > 0:
-            # Determine match type
-            if name_score >= district_score and name_score >= district_ta_score:
-                match_type = "name"
-            elif name_ta_score >= district_score and name_ta_score >= district_ta_score:
-                match_type = "name"
-            else:
-                match_type = "district"
+    def scored_matches():
+        # Yields (sort key, match type, index entry); result dicts are only
+        # built for the entries that make the cut.
+        for constituency in search_index.constituencies:
+            # Score against constituency name
+            name_score = max(
+                _fuzzy_match_score(query_lower, constituency.name_lower),
+                _fuzzy_match_score(query_normalized, constituency.name_normalized),
+            )
             
-            scored_results.append({
-                "id": constituency.id,
-                "name": constituency.name,
-                "name_ta": constituency.name_ta or "",
-                "district": district,
-                "district_ta": constituency.district_ta or "",
-                "bounds": _calculate_bounds(constituency.boundary_geojson),
-                "match_type": match_type,
-                "score": best_score,
-                "is_district_result": False,
-            })
-        
-        # Group by district for district-level results
-        if district:
-            if district not in district_constituencies:
-                district_constituencies[district] = []
-            district_constituencies[district].append(constituency)
-    
-    # Add district-level results (shows "X constituencies in District")
-    for district, const_list in district_constituencies.items():
-        district_lower = district.lower()
-        district_score = _fuzzy_match_score(query_lower, district_lower)
-        
-        # Also check Tamil district name from first constituency
-        district_ta = const_list[0].district_ta or "" if const_list else ""
-        district_ta_score = _fuzzy_match_score(query_lower, district_ta.lower())
-        
-        best_district_score = max(district_score, district_ta_score)
-        
-        if best_district_score >= 0.7:  # Higher threshold for district-level results
-            # Calculate combined bounds for all constituencies in district
-            all_bounds = [_calculate_bounds(c.boundary_geojson) for c in const_list]
-            all_bounds = [b for b in all_bounds if b]
+            # Score against Tamil name
+            name_ta_score = _fuzzy_match_score(query_lower, constituency.name_ta_lower)
             
-            if all_bounds:
-                min_lat = min(b[0][0] for b in all_bounds)
-                min_lng = min(b[0][1] for b in all_bounds)
-                max_lat = max(b[1][0] for b in all_bounds)
-                max_lng = max(b[1][1] for b in all_bounds)
-                combined_bounds = [[min_lat, min_lng], [max_lat, max_lng]]
-            else:
-                combined_bounds = None
+            # Score against district
+            district_score = _fuzzy_match_score(query_lower, constituency.district_lower)
+            district_ta_score = _fuzzy_match_score(query_lower, constituency.district_ta_lower)
             
-            scored_results.append({
+            # Best score for this constituency
+            best_score = max(name_score, name_ta_score, district_score, district_ta_score)
+            
+            if best_score > 0:
+                # Determine match type
+                if name_score >= district_score and name_score >= district_ta_score:
+                    match_type = "name"
+                elif name_ta_score >= district_score and name_ta_score >= district_ta_score:
+                    match_type = "name"
+                else:
+                    match_type = "district"
+                yield (-best_score, type_priority[match_type], constituency.name_lower), match_type, constituency
+        
+        # District-level results (shows "X constituencies in District")
+        for district in search_index.districts:
+            best_district_score = max(
+                _fuzzy_match_score(query_lower, district.district_lower),
+                _fuzzy_match_score(query_lower, district.district_ta_lower),
+            )
+            if best_district_score >= 0.7:  # Higher threshold for district-level results
+                # Slight boost for district groups
+                sort_key = (
+                    -(best_district_score + 0.1),
+                    type_priority["district_group"],
+                    f"{district.district_lower} district",
+                )
+                yield sort_key, "district_group", district
+    
+    # Index ids and district names are unique, so the top 15 by sort key are
+    # the results; nsmallest keeps them without sorting every match.
+    unique_results = []
+    for _sort_key, match_type, entry in heapq.nsmallest(15, scored_matches(), key=itemgetter(0)):
+        if match_type == "district_group":
+            district_ta = entry.district_ta
+            unique_results.append({
                 "id": None,  # District-level result, no single ID
-                "name": f"{district} District",
+                "name": f"{entry.district} District",
                 "name_ta": f"{district_ta} மாவட்டம்" if district_ta else "",
-                "district": district,
+                "district": entry.district,
                 "district_ta": district_ta,
-                "bounds": combined_bounds,
-                "match_type": "district_group",
-                "score": best_district_score + 0.1,  # Slight boost for district groups
-                "is_district_result": True,
-                "constituency_count": len(const_list),
+                "bounds": entry.bounds,
+                "match_type": match_type,
+                "constituency_count": entry.constituency_count,
             })
-    
-    # Sort by score (descending), then by match type, then alphabetically
-    def sort_key(item):
-        # Priority: higher score first, then name matches, then district matches
-        type_priority = {"name": 0, "district_group": 1, "district": 2}
-        return (
-            -item["score"],
-            type_priority.get(item["match_type"], 3),
-            item["name"].lower(),
-        )
-    
-    scored_results.sort(key=sort_key)
-    
-    # Remove duplicates (keep highest scored version)
-    seen_ids = set()
-    seen_districts = set()
-    unique_results = []
-    
-    for result in scored_results:
-        if result["is_district_result"]:
-            if result["district"] not in seen_districts:
-                seen_districts.add(result["district"])
-                unique_results.append(result)
         else:
-            if result["id"] not in seen_ids:
-                seen_ids.add(result["id"])
-                unique_results.append(result)
-    
-    # Limit results
-    unique_results = unique_results[:15]
-    
-    # Clean up internal fields before returning
-    for result in unique_results:
-        result.pop("score", None)
-        result.pop("is_district_result", None)
+            unique_results.append({
+                "id": entry.id,
+                "name": entry.name,
+                "name_ta": entry.name_ta,
+                "district": entry.district,
+                "district_ta": entry.district_ta,
+                "bounds": entry.bounds,
+                "match_type": match_type,
+            })
     
     return JsonResponse({"results": unique_results})
 
 
+@cache_control(public=True, max_age=JSON_CACHE_SECONDS)
 def party_dashboard_search(request):
     """Return parties and candidates matching search query for party dashboard autocomplete."""
     query = request.GET.get("q", "").strip()
@@ -661,13 +1044,11 @@ def party_dashboard_search(request):
         return JsonResponse({"results": []})
 
     query_lower = query.lower()
-    district_key = ("2021_district", "district")
-    constituency_key = ("2021_constituency", "constituency")
 
     # Score parties
     party_names: dict[str, str] = {}  # raw name -> display name
     for row in rows:
-        party = (row.get("party") or "").strip() or "Independent / Unknown"
+        party = row.party or "Independent / Unknown"
         if party not in party_names:
             party_names[party] = _display_party_name(party)
 
@@ -691,8 +1072,8 @@ def party_dashboard_search(request):
     # Score candidates (deduplicate by name+party)
     seen_candidates: set[tuple[str, str]] = set()
     for row in rows:
-        candidate = (row.get("candidate") or "").strip()
-        party = (row.get("party") or "").strip() or "Independent / Unknown"
+        candidate = row.candidate
+        party = row.party or "Independent / Unknown"
         if not candidate or (candidate, party) in seen_candidates:
             continue
         seen_candidates.add((candidate, party))
@@ -703,8 +1084,8 @@ def party_dashboard_search(request):
                 "name": candidate,
                 "party": party,
                 "party_display": _display_party_name(party),
-                "constituency": _row_value(row, constituency_key),
-                "district": _row_value(row, district_key),
+                "constituency": row.constituency,
+                "district": row.district,
                 "score": score,
             })
 
@@ -722,71 +1103,115 @@ def set_language(request, language: str):
     next_url = request.GET.get("next") or reverse("home")
     return redirect(next_url)
 
+PARTY_LOOKUPS_CACHE_KEY = "core:party_lookups"
+# Parties rarely change and carry no update timestamp to version a key by, so
+# their lookups are shared across requests and refreshed on a timeout.
+PARTY_LOOKUPS_SECONDS = 10 * 60
+
+
+def _party_lookups() -> tuple[dict[str, str], dict[str, int]]:
+    """Return symbol URL and party id by lowercased party name or abbreviation."""
+    lookups = cache.get(PARTY_LOOKUPS_CACHE_KEY)
+    if lookups is None:
+        symbol_by_key: dict[str, str] = {}
+        id_by_key: dict[str, int] = {}
+        for party_id, name, abbreviation, symbol_url in Party.objects.values_list(
+            "id", "name", "abbreviation", "symbol_url"
+        ):
+            for key in (name, abbreviation):
+                if key:
+                    key = key.strip().lower()
+                    id_by_key[key] = party_id
+                    if symbol_url:
+                        symbol_by_key[key] = symbol_url
+        lookups = (symbol_by_key, id_by_key)
+        cache.set(PARTY_LOOKUPS_CACHE_KEY, lookups, PARTY_LOOKUPS_SECONDS)
+    return lookups
+
+
+def _localized_text(field: str, language: str):
+    """Select the Tamil variant of ``field`` when the language is Tamil and it is non-empty.
+
+    The choice is made in the query, so only one of the two text columns is
+    transferred per row.
+    """
+    if language == "ta":
+        return Coalesce(NullIf(f"{field}_ta", Value("")), field, output_field=TextField())
+    return F(field)
+
+
+def _summarize_assessments(assessments: Iterable[Optional[dict]]) -> dict:
+    """Reduce promise assessments (None for unassessed promises) to the delivery card fields."""
+    status_counts: Counter = Counter()
+    scores = []
+    summary = ""
+    as_of = None
+    for assessment in assessments:
+        if not assessment:
+            continue
+        status_counts[assessment["status"]] += 1
+        if assessment["score"] is not None:
+            try:
+                scores.append(float(assessment["score"]))
+            except (TypeError, ValueError):
+                pass
+        text_summary = (assessment["display_summary"] or "").strip()
+        if text_summary and not summary:
+            summary = text_summary
+            as_of = assessment["as_of"]
+    avg_score = (sum(scores) / len(scores)) if scores else None
+    return {
+        "avg_score": round(avg_score, 2) if avg_score is not None else None,
+        "breakdown": {key: status_counts[key] for key in PromiseAssessment.Status.values},
+        "summary": summary,
+        "as_of": as_of,
+    }
+
+
+@lru_cache(maxsize=512)
+def _constituency_summary_values(dataset: CandidateDataset, constituency_key: str) -> tuple[str, ...]:
+    """Return the formatted summary card values for one constituency's candidates.
+
+    They depend only on the dataset rows, not on the language or the request,
+    so each constituency's values are computed once per parsed CSV.
+    """
+    candidates = dataset.by_constituency.get(constituency_key, ())
+    # One walk over the candidates accumulates every column's total and count.
+    totals = [0, 0, 0, 0]
+    counts = [0, 0, 0, 0]
+    parties = set()
+    for row in candidates:
+        for position, value in enumerate((row.criminal_cases, row.age, row.total_assets, row.liabilities)):
+            if value is not None:
+                totals[position] += value
+                counts[position] += 1
+        if row.party:
+            parties.add(row.party)
+
+    party_count = len(parties)
+    avg_cases, avg_age, avg_assets, avg_liabilities = (
+        total / count if count else None for total, count in zip(totals, counts)
+    )
+    return (
+        _format_indian_number(len(candidates)),
+        _format_indian_number(party_count),
+        _format_indian_number(round(avg_cases, 2) if avg_cases is not None else None),
+        _format_indian_number(round(avg_age, 1) if avg_age is not None else None),
+        f"₹ {short_indian(round(avg_assets, 0))}" if avg_assets is not None else "N/A",
+        f"₹ {short_indian(round(avg_liabilities, 0))}" if avg_liabilities is not None else "N/A",
+    )
+
+
 def constituency_detail(request, constituency_id: int):
     constituency = get_object_or_404(
         Constituency.objects.all(),
         pk=constituency_id,
     )
-    party_symbols: dict[str, str] = {}
-    for party in Party.objects.exclude(symbol_url="").only("name", "abbreviation", "symbol_url"):
-        if party.name:
-            party_symbols[party.name.strip().lower()] = party.symbol_url
-        if party.abbreviation:
-            party_symbols[party.abbreviation.strip().lower()] = party.symbol_url
-    rows = _load_smla_rows()
-    constituency_seen: set[str] = set()
-    district_candidates: dict[str, set[str]] = defaultdict(set)
-    alias_by_district: dict[str, dict[str, str]] = defaultdict(dict)
-    for row in rows:
-        constituency_key = _normalize_constituency_name(row.get("2021_constituency"))
-        district_key = _normalize_constituency_name(row.get("2021_district"))
-        if constituency_key:
-            constituency_seen.add(constituency_key)
-            if district_key:
-                district_candidates[district_key].add(constituency_key)
-            official_key = _normalize_constituency_name(row.get("const_off"))
-            if official_key:
-                alias_by_district[district_key][official_key] = constituency_key
-                alias_by_district[""].setdefault(official_key, constituency_key)
-    explicit_aliases = {
-        "PALACODU": "PALACODE",
-        "THALLI": "THALLY",
-        "SHOZHINGANALLUR": "SHOLINGANALLUR",
-        "VANDAVASI": "VANDAVASI SC",
-        "VANDAVASI SC": "VANDAVASI SC",
-    }
-    for raw, mapped in explicit_aliases.items():
-        alias_by_district[""].setdefault(raw, mapped)
-        for district_key in district_candidates.keys():
-            alias_by_district[district_key].setdefault(raw, mapped)
-    explicit_district_aliases = {
-        "TIRUVANNAMALAI": {"VANDAVASI SC": "VANDAVASI SC", "VANDAVASI": "VANDAVASI SC"},
-        "VILUPPURAM": {"VANDAVASI SC": "VANDAVASI SC", "VANDAVASI": "VANDAVASI SC"},
-        "TIRUPATHUR": {"TIRUPPATTUR": "TIRUPATTUR"},
-        "VELLORE": {"TIRUPPATTUR": "TIRUPATTUR"},
-        "SIVAGANGA": {"TIRUPPATTUR": "TIRUPPATHUR"},
-    }
-    for district_key, mapping in explicit_district_aliases.items():
-        for raw, mapped in mapping.items():
-            alias_by_district[district_key].setdefault(raw, mapped)
-
-    # Force correct global alias for Tirupathur (overrides any auto-generated alias)
-    # GeoJSON has "Tiruppattur" -> normalized "TIRUPPATTUR", CSV has "TIRUPATTUR"
-    alias_by_district[""]["TIRUPPATTUR"] = "TIRUPATTUR"
-
-    constituency_key = _resolve_constituency_key(
-        _normalize_constituency_name(constituency.name),
-        _normalize_constituency_name(constituency.district),
-        constituency_seen,
-        district_candidates,
-        alias_by_district,
-        cutoff=0.85,
-    )
-    candidates = [
-        row for row in rows
-        if _normalize_constituency_name(row.get("2021_constituency")) == constituency_key
-    ]
-    district_name = (candidates[0].get("2021_district") if candidates else None) or constituency.district
+    party_symbols, party_id_by_key = _party_lookups()
+    dataset = _load_smla_dataset()
+    constituency_key = _detail_constituency_key(dataset, constituency.name, constituency.district)
+    candidates = dataset.by_constituency.get(constituency_key, ())
+    district_name = (candidates[0].district if candidates else None) or constituency.district
     current_language = request.session.get("language", "en")
 
     REGION_TA = {
@@ -801,257 +1226,198 @@ def constituency_detail(request, constituency_id: int):
     region_display = REGION_TA.get(region_raw, region_raw) if current_language == "ta" else region_raw
 
     # Attach key promises for each party/coalition (best-effort; missing data is OK).
-    party_lookup: dict[str, Party] = {}
-    for party in Party.objects.all().only("id", "name", "abbreviation"):
-        if party.name:
-            party_lookup[party.name.strip().lower()] = party
-        if party.abbreviation:
-            party_lookup[party.abbreviation.strip().lower()] = party
-
     party_ids: set[int] = set()
     for row in candidates:
-        raw_party = (row.get("party") or "").strip().lower()
-        match = party_lookup.get(raw_party)
-        if match:
-            party_ids.add(match.id)
+        party_id = party_id_by_key.get(row.party.lower())
+        if party_id:
+            party_ids.add(party_id)
 
+    # Coalitions and claims are read for the 2021 election when it exists and
+    # across all elections otherwise; the existence check runs inside each query.
+    no_election_2021 = ~Exists(Election.objects.filter(year=2021))
     coalition_by_party_id: dict[int, int] = {}
     if party_ids:
-        election_2021 = Election.objects.filter(year=2021).first()
-        memberships = CoalitionMembership.objects.select_related("coalition", "coalition__election").filter(
-            party_id__in=party_ids
-        )
-        if election_2021:
-            memberships = memberships.filter(coalition__election=election_2021)
-        for membership in memberships:
-            if membership.party_id and membership.coalition_id:
-                coalition_by_party_id.setdefault(membership.party_id, membership.coalition_id)
-
-    manifesto_by_party_id: dict[int, Manifesto] = {}
-    manifesto_by_coalition_id: dict[int, Manifesto] = {}
+        memberships = CoalitionMembership.objects.filter(
+            Q(coalition__election__year=2021) | no_election_2021,
+            party_id__in=party_ids,
+        ).values_list("party_id", "coalition_id")
+        for membership_party_id, coalition_id in memberships:
+            if membership_party_id and coalition_id:
+                coalition_by_party_id.setdefault(membership_party_id, coalition_id)
+
+    manifesto_id_by_party_id: dict[int, int] = {}
+    manifesto_id_by_coalition_id: dict[int, int] = {}
     promise_chips_by_manifesto_id: dict[int, list[dict]] = {}
-    state_assessment_by_party_promise: dict[tuple[int, int], PromiseAssessment] = {}
-    constituency_assessment_by_promise: dict[int, PromiseAssessment] = {}
-    claim_by_party_id: dict[int, PartyFulfilmentClaim] = {}
+    # Manifestos and promises are read as values_list() tuples, assessments
+    # and claims as values() dicts, rather than as model instances.
+    state_assessment_by_party_promise: dict[tuple[int, int], dict] = {}
+    constituency_assessment_by_promise: dict[int, dict] = {}
+    claim_by_party_id: dict[int, dict] = {}
     if party_ids:
         coalition_ids = {cid for cid in coalition_by_party_id.values() if cid}
         manifestos = (
             Manifesto.objects.filter(constituency__isnull=True, candidate__isnull=True)
             .filter(Q(party_id__in=party_ids) | Q(coalition_id__in=coalition_ids))
-            .select_related("party", "coalition")
             .order_by("-last_updated", "-id")
+            .values_list("id", "party_id", "coalition_id")
         )
-        for manifesto in manifestos:
-            if manifesto.coalition_id and manifesto.coalition_id not in manifesto_by_coalition_id:
-                manifesto_by_coalition_id[manifesto.coalition_id] = manifesto
-            if manifesto.party_id and manifesto.party_id not in manifesto_by_party_id:
-                manifesto_by_party_id[manifesto.party_id] = manifesto
-
-        selected_manifesto_ids = {
-            m.id for m in list(manifesto_by_party_id.values()) + list(manifesto_by_coalition_id.values()) if m
-        }
+        for manifesto_id, manifesto_party_id, manifesto_coalition_id in manifestos:
+            if manifesto_coalition_id:
+                manifesto_id_by_coalition_id.setdefault(manifesto_coalition_id, manifesto_id)
+            if manifesto_party_id:
+                manifesto_id_by_party_id.setdefault(manifesto_party_id, manifesto_id)
+
+        selected_manifesto_ids = {*manifesto_id_by_party_id.values(), *manifesto_id_by_coalition_id.values()}
         if selected_manifesto_ids:
             promises = (
                 ManifestoPromise.objects.filter(manifesto_id__in=selected_manifesto_ids, is_key=True)
-                .only("id", "manifesto_id", "slug", "text", "text_ta", "position")
                 .order_by("position", "id")
+                .values_list("id", "manifesto_id", "slug", _localized_text("text", current_language))
             )
-            for promise in promises:
-                bucket = promise_chips_by_manifesto_id.setdefault(promise.manifesto_id, [])
+            for promise_id, promise_manifesto_id, slug, display_text in promises:
+                bucket = promise_chips_by_manifesto_id.setdefault(promise_manifesto_id, [])
                 if len(bucket) >= 4:
                     continue
-                text = (
-                    promise.text_ta.strip()
-                    if current_language == "ta" and promise.text_ta
-                    else (promise.text.strip() if promise.text else "")
-                )
+                text = (display_text or "").strip()
                 if not text:
                     continue
-                bucket.append({"id": promise.id, "slug": promise.slug, "text": text})
+                bucket.append({"id": promise_id, "slug": slug, "text": text})
 
             promise_ids = {chip["id"] for chips in promise_chips_by_manifesto_id.values() for chip in chips if chip.get("id")}
             if promise_ids:
-                state_qs = (
-                    PromiseAssessment.objects.filter(
-                        scope=PromiseAssessment.Scope.STATE,
-                        party_id__in=party_ids,
-                        promise_id__in=promise_ids,
-                    )
-                    .only("id", "promise_id", "party_id", "status", "score", "summary", "summary_ta", "as_of")
-                    .order_by("-as_of", "-id")
+                # State and constituency assessments come back in one query
+                # and are split by scope here.
+                assessments = PromiseAssessment.objects.filter(
+                    Q(scope=PromiseAssessment.Scope.STATE, party_id__in=party_ids)
+                    | Q(scope=PromiseAssessment.Scope.CONSTITUENCY, constituency=constituency),
+                    promise_id__in=promise_ids,
+                ).values(
+                    "scope",
+                    "promise_id",
+                    "party_id",
+                    "status",
+                    "score",
+                    "as_of",
+                    display_summary=_localized_text("summary", current_language),
                 )
-                for assessment in state_qs:
-                    key = (assessment.party_id or 0, assessment.promise_id)
-                    if key not in state_assessment_by_party_promise:
-                        state_assessment_by_party_promise[key] = assessment
-
-                const_qs = (
-                    PromiseAssessment.objects.filter(
-                        scope=PromiseAssessment.Scope.CONSTITUENCY,
-                        constituency=constituency,
-                        promise_id__in=promise_ids,
+                if connection.features.can_distinct_on_fields:
+                    # PostgreSQL returns only the latest assessment per key
+                    # below: per party and promise for STATE, per promise for
+                    # CONSTITUENCY (whose dedupe_party_id is always NULL).
+                    assessments = (
+                        assessments.annotate(
+                            dedupe_party_id=Case(
+                                When(scope=PromiseAssessment.Scope.STATE, then=F("party_id")),
+                                default=Value(None),
+                                output_field=IntegerField(),
+                            )
+                        )
+                        .order_by("scope", "promise_id", "dedupe_party_id", "-as_of", "-id")
+                        .distinct("scope", "promise_id", "dedupe_party_id")
                     )
-                    .only("id", "promise_id", "status", "score", "summary", "summary_ta", "as_of")
-                    .order_by("-as_of", "-id")
-                )
-                for assessment in const_qs:
-                    if assessment.promise_id not in constituency_assessment_by_promise:
-                        constituency_assessment_by_promise[assessment.promise_id] = assessment
-
-            election_2021 = Election.objects.filter(year=2021).first()
-            claim_qs = PartyFulfilmentClaim.objects.filter(party_id__in=party_ids).select_related(
-                "source_document", "election"
-            )
-            if election_2021:
-                claim_qs = claim_qs.filter(election=election_2021)
-            claim_qs = claim_qs.order_by("-as_of", "-id")
+                else:
+                    # Oldest first, so the latest row per key is the one
+                    # left in the dicts below.
+                    assessments = assessments.order_by("as_of", "id")
+                for assessment in assessments:
+                    if assessment["scope"] == PromiseAssessment.Scope.STATE:
+                        key = (assessment["party_id"] or 0, assessment["promise_id"])
+                        state_assessment_by_party_promise[key] = assessment
+                    else:
+                        constituency_assessment_by_promise[assessment["promise_id"]] = assessment
+
+            claim_qs = PartyFulfilmentClaim.objects.filter(
+                Q(election__year=2021) | no_election_2021, party_id__in=party_ids
+            ).values("party_id", "claimed_percent", "as_of", "source_document__url")
+            if connection.features.can_distinct_on_fields:
+                claim_qs = claim_qs.order_by("party_id", "-as_of", "-id").distinct("party_id")
+            else:
+                claim_qs = claim_qs.order_by("as_of", "id")
             for claim in claim_qs:
-                if claim.party_id and claim.party_id not in claim_by_party_id:
-                    claim_by_party_id[claim.party_id] = claim
-
-    cases_values = [_parse_int(row.get("criminal_cases")) for row in candidates]
-    cases_values = [value for value in cases_values if value is not None]
-    age_values = [_parse_int(row.get("age")) for row in candidates]
-    age_values = [value for value in age_values if value is not None]
-    assets_values = [_parse_int(row.get("total_assets_rs")) for row in candidates]
-    assets_values = [value for value in assets_values if value is not None]
-    liabilities_values = [_parse_int(row.get("liabilities_rs")) for row in candidates]
-    liabilities_values = [value for value in liabilities_values if value is not None]
-
-    candidate_count = len(candidates)
-    party_count = len({(row.get("party") or "").strip() for row in candidates if (row.get("party") or "").strip()})
-    cases_positive = sum(1 for value in cases_values if value and value > 0)
-    avg_cases = (sum(cases_values) / len(cases_values)) if cases_values else None
-    avg_age = (sum(age_values) / len(age_values)) if age_values else None
-    avg_assets = (sum(assets_values) / len(assets_values)) if assets_values else None
-    avg_liabilities = (sum(liabilities_values) / len(liabilities_values)) if liabilities_values else None
-    cases_pct = round((cases_positive / candidate_count) * 100, 1) if candidate_count else 0
-
+                claim_by_party_id[claim["party_id"]] = claim
+
+    (
+        candidate_count_value,
+        party_count_value,
+        avg_cases_value,
+        avg_age_value,
+        avg_assets_value,
+        avg_liabilities_value,
+    ) = _constituency_summary_values(dataset, constituency_key)
     _ta = current_language == "ta"
     summary_cards = [
-        {"label": "வேட்பாளர்கள்" if _ta else "Candidates", "value": _format_indian_number(candidate_count)},
-        {"label": "கட்சிகள்" if _ta else "Parties", "value": _format_indian_number(party_count)},
-        {"label": "சராசரி வழக்குகள்" if _ta else "Avg cases", "value": _format_indian_number(round(avg_cases, 2) if avg_cases is not None else None)},
-        {"label": "சராசரி வயது" if _ta else "Avg age", "value": _format_indian_number(round(avg_age, 1) if avg_age is not None else None)},
-        {
-            "label": "சராசரி சொத்துகள்" if _ta else "Avg assets",
-            "value": f"₹ {short_indian(round(avg_assets, 0))}" if avg_assets is not None else "N/A",
-        },
-        {
-            "label": "சராசரி கடன்கள்" if _ta else "Avg liabilities",
-            "value": f"₹ {short_indian(round(avg_liabilities, 0))}" if avg_liabilities is not None else "N/A",
-        },
+        {"label": "வேட்பாளர்கள்" if _ta else "Candidates", "value": candidate_count_value},
+        {"label": "கட்சிகள்" if _ta else "Parties", "value": party_count_value},
+        {"label": "சராசரி வழக்குகள்" if _ta else "Avg cases", "value": avg_cases_value},
+        {"label": "சராசரி வயது" if _ta else "Avg age", "value": avg_age_value},
+        {"label": "சராசரி சொத்துகள்" if _ta else "Avg assets", "value": avg_assets_value},
+        {"label": "சராசரி கடன்கள்" if _ta else "Avg liabilities", "value": avg_liabilities_value},
     ]
 
+    # Sitting MLAs of one party share its manifesto's key promises, so their
+    # delivery summaries are computed once per party and manifesto.
+    deliveries_by_party_manifesto: dict[tuple[int, int], tuple[dict, dict]] = {}
     candidate_cards = []
     for row in candidates:
-        assets_value = _parse_int(row.get("total_assets_rs"))
-        liabilities_value = _parse_int(row.get("liabilities_rs"))
-        raw_party = (row.get("party") or "").strip()
-        party_obj = party_lookup.get(raw_party.strip().lower()) if raw_party else None
-        coalition_id = coalition_by_party_id.get(party_obj.id) if party_obj else None
-        manifesto = (
-            manifesto_by_coalition_id.get(coalition_id) if coalition_id else None
-        ) or (manifesto_by_party_id.get(party_obj.id) if party_obj else None)
-        key_promises = promise_chips_by_manifesto_id.get(manifesto.id, []) if manifesto else []
-
-        state_delivery = None
-        constituency_delivery = None
-        if str(row.get("sitting_MLA", "")).strip() == "1" and party_obj and key_promises:
+        raw_party = row.party
+        party_key = raw_party.lower()
+        card = {
+            "name": row.candidate or "Unknown",
+            "party": raw_party or "Independent / Unknown",
+            "party_symbol": _party_symbol_url(raw_party) or party_symbols.get(party_key),
+            "is_2016": row.is_2016,
+            "education": row.education,
+            "age": row.age,
+            "criminal_cases": row.criminal_cases,
+            "assets": row.total_assets,
+            "liabilities": row.liabilities,
+            "sitting": row.sitting == 1,
+            "myneta_url": row.myneta_url,
+            "key_promises": [],
+            "state_delivery": None,
+            "constituency_delivery": None,
+        }
+        candidate_cards.append(card)
+
+        # Independents and unknown parties have no manifesto to look up.
+        party_id = party_id_by_key.get(party_key) if raw_party else None
+        if not party_id:
+            continue
+        coalition_id = coalition_by_party_id.get(party_id)
+        manifesto_id = (
+            manifesto_id_by_coalition_id.get(coalition_id) if coalition_id else None
+        ) or manifesto_id_by_party_id.get(party_id)
+        key_promises = promise_chips_by_manifesto_id.get(manifesto_id, []) if manifesto_id else []
+        card["key_promises"] = key_promises
+        # Delivery cards are only shown for sitting MLAs with key promises.
+        if row.sitting != 1 or not key_promises:
+            continue
+
+        delivery_key = (party_id, manifesto_id)
+        deliveries = deliveries_by_party_manifesto.get(delivery_key)
+        if deliveries is None:
             promise_ids = [chip["id"] for chip in key_promises if chip.get("id")]
-            statuses = []
-            scores = []
-            summary_text = ""
-            summary_as_of = None
-            for pid in promise_ids:
-                assessment = state_assessment_by_party_promise.get((party_obj.id, pid))
-                if not assessment:
-                    continue
-                statuses.append(assessment.status)
-                if assessment.score is not None:
-                    try:
-                        scores.append(float(assessment.score))
-                    except (TypeError, ValueError):
-                        pass
-                text_summary = (
-                    assessment.summary_ta.strip()
-                    if current_language == "ta" and assessment.summary_ta
-                    else (assessment.summary.strip() if assessment.summary else "")
-                )
-                if text_summary and not summary_text:
-                    summary_text = text_summary
-                    summary_as_of = assessment.as_of
-
-            breakdown = {key: statuses.count(key) for key in PromiseAssessment.Status.values}
-            scored_count = len(scores)
-            avg_score = (sum(scores) / scored_count) if scored_count else None
-            claim = claim_by_party_id.get(party_obj.id)
+            claim = claim_by_party_id.get(party_id)
             claim_label = None
             claim_url = None
             claim_as_of = None
-            if claim and claim.claimed_percent is not None:
-                claim_label = f"{claim.claimed_percent}%"
-                claim_url = claim.source_document.url if getattr(claim, "source_document", None) else ""
-                claim_as_of = claim.as_of
-
-            state_delivery = {
-                "claim_percent": claim_label,
-                "claim_url": claim_url or "",
-                "claim_as_of": claim_as_of,
-                "avg_score": round(avg_score, 2) if avg_score is not None else None,
-                "breakdown": breakdown,
-                "summary": summary_text,
-                "as_of": summary_as_of,
-            }
-
-            c_statuses = []
-            c_scores = []
-            c_summary = ""
-            c_as_of = None
-            for pid in promise_ids:
-                assessment = constituency_assessment_by_promise.get(pid)
-                if not assessment:
-                    continue
-                c_statuses.append(assessment.status)
-                if assessment.score is not None:
-                    try:
-                        c_scores.append(float(assessment.score))
-                    except (TypeError, ValueError):
-                        pass
-                text_summary = (
-                    assessment.summary_ta.strip()
-                    if current_language == "ta" and assessment.summary_ta
-                    else (assessment.summary.strip() if assessment.summary else "")
-                )
-                if text_summary and not c_summary:
-                    c_summary = text_summary
-                    c_as_of = assessment.as_of
-            c_breakdown = {key: c_statuses.count(key) for key in PromiseAssessment.Status.values}
-            c_avg = (sum(c_scores) / len(c_scores)) if c_scores else None
-            constituency_delivery = {
-                "avg_score": round(c_avg, 2) if c_avg is not None else None,
-                "breakdown": c_breakdown,
-                "summary": c_summary,
-                "as_of": c_as_of,
-            }
-        candidate_cards.append(
-            {
-                "name": (row.get("candidate") or "").strip() or "Unknown",
-                "party": (row.get("party") or "").strip() or "Independent / Unknown",
-                "party_symbol": _party_symbol_url(raw_party) or party_symbols.get(raw_party.lower()),
-                "is_2016": _is_2016_row(row),
-                "education": (row.get("education") or "").strip(),
-                "age": _parse_int(row.get("age")),
-                "criminal_cases": _parse_int(row.get("criminal_cases")),
-                "assets": assets_value,
-                "liabilities": liabilities_value,
-                "sitting": str(row.get("sitting_MLA", "")).strip() == "1",
-                "myneta_url": (row.get("myneta_url") or "").strip(),
-                "key_promises": key_promises,
-                "state_delivery": state_delivery,
-                "constituency_delivery": constituency_delivery,
-            }
-        )
+            if claim and claim["claimed_percent"] is not None:
+                claim_label = f"{claim['claimed_percent']}%"
+                claim_url = claim["source_document__url"]
+                claim_as_of = claim["as_of"]
+            state_summary = _summarize_assessments(
+                state_assessment_by_party_promise.get((party_id, pid)) for pid in promise_ids
+            )
+            deliveries = deliveries_by_party_manifesto[delivery_key] = (
+                {
+                    "claim_percent": claim_label,
+                    "claim_url": claim_url or "",
+                    "claim_as_of": claim_as_of,
+                    **state_summary,
+                },
+                _summarize_assessments(map(constituency_assessment_by_promise.get, promise_ids)),
+            )
+        card["state_delivery"], card["constituency_delivery"] = deliveries
     candidate_cards.sort(key=lambda c: (not c["sitting"],))
     return render(
         request,
@@ -1071,7 +1437,19 @@ def candidate_detail(request, candidate_id: int):
     candidate = get_object_or_404(
         Candidate.objects.select_related("party", "constituency")
         .prefetch_related(
-            "affidavits",
+            # The page shows only the affidavit totals, so the additional_details
+            # JSON and education text are left in the database.
+            Prefetch(
+                "affidavits",
+                queryset=Affidavit.objects.only(
+                    "id",
+                    "candidate_id",
+                    "criminal_cases_count",
+                    "serious_criminal_cases_count",
+                    "assets_total",
+                    "liabilities_total",
+                ),
+            ),
             "legal_cases",
             Prefetch(
                 "results",
@@ -1106,21 +1484,43 @@ def search(request):
     candidates = []
     parties = []
     if query:
-        constituencies = Constituency.objects.filter(
-            Q(name__icontains=query)
-            | Q(name_ta__icontains=query)
-            | Q(district__icontains=query)
-            | Q(district_ta__icontains=query)
-        )[:25]
-        candidates = Candidate.objects.select_related("party", "constituency").filter(
-            Q(name__icontains=query)
-            | Q(name_ta__icontains=query)
-            | Q(party__name__icontains=query)
-            | Q(party__name_ta__icontains=query)
-            | Q(constituency__name__icontains=query)
-            | Q(constituency__name_ta__icontains=query)
-        )[:25]
-        parties = Party.objects.filter(Q(name__icontains=query) | Q(name_ta__icontains=query))[:25]
+        # On PostgreSQL these icontains lookups are served by the pg_trgm GIN
+        # indexes added in migration 0007 instead of sequential scans. Every
+        # branch selects the same (kind, id, name, name_ta, constituency name,
+        # constituency name_ta) columns so the three can share one UNION ALL.
+        branches = (
+            Constituency.objects.filter(
+                Q(name__icontains=query)
+                | Q(name_ta__icontains=query)
+                | Q(district__icontains=query)
+                | Q(district_ta__icontains=query)
+            ).values_list(Value("constituency"), "id", "name", "name_ta", Value(""), Value(""))[:25],
+            Candidate.objects.filter(
+                Q(name__icontains=query)
+                | Q(name_ta__icontains=query)
+                | Q(party__name__icontains=query)
+                | Q(party__name_ta__icontains=query)
+                | Q(constituency__name__icontains=query)
+                | Q(constituency__name_ta__icontains=query)
+            ).values_list(
+                Value("candidate"), "id", "name", "name_ta", "constituency__name", "constituency__name_ta"
+            )[:25],
+            Party.objects.filter(Q(name__icontains=query) | Q(name_ta__icontains=query)).values_list(
+                Value("party"), "id", "name", "name_ta", Value(""), Value("")
+            )[:25],
+        )
+        if connection.features.supports_slicing_ordering_in_compound:
+            # One round trip on PostgreSQL; SQLite cannot LIMIT the parts of a
+            # compound query, so it runs the branches one after another.
+            result_rows = branches[0].union(*branches[1:], all=True)
+        else:
+            result_rows = chain.from_iterable(branches)
+        results_by_kind = {"constituency": constituencies, "candidate": candidates, "party": parties}
+        for kind, pk, name, name_ta, constituency_name, constituency_name_ta in result_rows:
+            result = {"id": pk, "name": name, "name_ta": name_ta}
+            if kind == "candidate":
+                result["constituency"] = {"name": constituency_name, "name_ta": constituency_name_ta}
+            results_by_kind[kind].append(result)
 
     return render(
         request,
@@ -1135,64 +1535,186 @@ def search(request):
 
 
 def data_quality_dashboard(request):
-    total_constituencies = Constituency.objects.count()
-    total_candidates = Candidate.objects.count()
-    constituencies_missing_candidates = Constituency.objects.filter(candidates__isnull=True).count()
-    candidates_missing_affidavit = Candidate.objects.filter(affidavits__isnull=True).count()
-    candidates_missing_legal = Candidate.objects.filter(legal_cases__isnull=True).count()
-    constituencies_missing_manifestos = Constituency.objects.filter(manifestos__isnull=True).count()
-    parties_missing_manifestos = Party.objects.filter(manifestos__isnull=True).count()
+    # One aggregate per base table. The "missing" checks are NOT EXISTS
+    # subqueries rather than LEFT JOINs, so the reverse relations do not
+    # multiply the rows being counted and no DISTINCT is needed.
+    constituency_stats = Constituency.objects.aggregate(
+        total=Count("id"),
+        missing_candidates=Count(
+            "id", filter=~Exists(Candidate.objects.filter(constituency_id=OuterRef("pk")))
+        ),
+        missing_manifestos=Count(
+            "id", filter=~Exists(Manifesto.objects.filter(constituency_id=OuterRef("pk")))
+        ),
+    )
+    candidate_stats = Candidate.objects.aggregate(
+        total=Count("id"),
+        missing_affidavit=Count("id", filter=~Exists(Affidavit.objects.filter(candidate_id=OuterRef("pk")))),
+        missing_legal=Count("id", filter=~Exists(LegalCase.objects.filter(candidate_id=OuterRef("pk")))),
+    )
+    party_stats = Party.objects.aggregate(
+        missing_manifestos=Count("id", filter=~Exists(Manifesto.objects.filter(party_id=OuterRef("pk")))),
+    )
 
     return render(
         request,
         "core/dashboard.html",
         {
-            "total_constituencies": total_constituencies,
-            "total_candidates": total_candidates,
-            "constituencies_missing_candidates": constituencies_missing_candidates,
-            "candidates_missing_affidavit": candidates_missing_affidavit,
-            "candidates_missing_legal": candidates_missing_legal,
-            "constituencies_missing_manifestos": constituencies_missing_manifestos,
-            "parties_missing_manifestos": parties_missing_manifestos,
+            "total_constituencies": constituency_stats["total"],
+            "total_candidates": candidate_stats["total"],
+            "constituencies_missing_candidates": constituency_stats["missing_candidates"],
+            "candidates_missing_affidavit": candidate_stats["missing_affidavit"],
+            "candidates_missing_legal": candidate_stats["missing_legal"],
+            "constituencies_missing_manifestos": constituency_stats["missing_manifestos"],
+            "parties_missing_manifestos": party_stats["missing_manifestos"],
         },
     )
 
 
+_DIGITS_RE = re.compile(r"\d+")
+
+
 def _parse_int(value: Optional[str]) -> Optional[int]:
     if not value:
         return None
-    match = re.search(r"\d+", str(value))
+    text = value if isinstance(value, str) else str(value)
+    # Most CSV cells are plain digit strings; only fall back to the regex for
+    # values like "Rs 1,200" or "3 cases".
+    if text.isdecimal():
+        return int(text)
+    match = _DIGITS_RE.search(text)
     return int(match.group(0)) if match else None
 
 
-def _row_value(row: dict, keys: tuple[str, ...]) -> str:
-    for key in keys:
-        value = (row.get(key) or "").strip()
-        if value:
-            return value
-    return ""
+DISTRICT_KEYS = ("2021_district", "district")
+CONSTITUENCY_KEYS = ("2021_constituency", "constituency")
+
+
+def _load_party_rows(csv_path: str) -> tuple[CandidateRow, ...]:
+    return _load_dataset(csv_path).rows
+
+
+# The latest parse of each candidates CSV, with the mtime it was read at. Only
+# one version per path is kept, so a changed file releases the old rows.
+_DATASETS_BY_PATH: dict[str, tuple[int, CandidateDataset]] = {}
 
 
-def _numeric_bounds(rows: list[dict], key: str) -> tuple[int, int]:
-    values = [_parse_int(row.get(key)) for row in rows]
-    values = [value for value in values if value is not None]
-    if not values:
-        return 0, 0
-    return min(values), max(values)
+def _load_dataset(csv_path: str) -> CandidateDataset:
+    """Return the parsed candidates CSV, re-reading it only when the file changes."""
+    try:
+        mtime_ns = Path(csv_path).stat().st_mtime_ns
+    except FileNotFoundError:
+        return EMPTY_DATASET
+    cached = _DATASETS_BY_PATH.get(csv_path)
+    if cached is None or cached[0] != mtime_ns:
+        dataset = _parse_candidate_csv(csv_path)
+        # The per-dataset caches would otherwise keep the superseded dataset
+        # alive until newer entries pushed it out.
+        for dataset_cache in DATASET_CACHES:
+            dataset_cache.cache_clear()
+        cached = _DATASETS_BY_PATH[csv_path] = (mtime_ns, dataset)
+    return cached[1]
+
+
+def _parse_candidate_csv(csv_path: str) -> CandidateDataset:
+    # csv.reader yields plain lists; fields are read by column index rather
+    # than through a dict per row as csv.DictReader would build.
+    with open(csv_path, "r", encoding="utf-8", newline="") as handle:
+        reader = csv.reader(handle)
+        header = tuple(next(reader, ()))
+        column = {name: index for index, name in enumerate(header)}
+        width = len(header)
+        get_fields = _row_fields_getter(column, width)
+        # Party, district, constituency and education take few distinct
+        # values, like a categorical column: equal values share one interned
+        # string, and each distinct name is normalized to its key only once.
+        # Case counts, ages and the sitting flag repeat too, so each distinct
+        # cell is parsed once; asset amounts are mostly unique and are not.
+        normalize = lru_cache(maxsize=None)(_normalize_constituency_name)
+        parse_count = lru_cache(maxsize=None)(_parse_int)
+        title_case = lru_cache(maxsize=None)(_title_case)
+        district_positions = tuple(column[key] for key in DISTRICT_KEYS if key in column)
+        constituency_position = next((column[key] for key in CONSTITUENCY_KEYS if key in column), None)
+        rows = tuple(
+            _candidate_row(
+                _pad_row(values, width),
+                column,
+                get_fields,
+                sys.intern,
+                normalize,
+                parse_count,
+                title_case,
+                district_positions,
+                constituency_position,
+            )
+            for values in reader
+            if values
+        )
+    by_constituency: dict[str, list[CandidateRow]] = defaultdict(list)
+    official_by_key: dict[str, str] = {}
+    for row in rows:
+        by_constituency[row.constituency_key].append(row)
+        if row.constituency_key and row.official_name:
+            official_by_key.setdefault(row.constituency_key, row.official_name)
+    columns = _dataset_columns(rows)
+    return CandidateDataset(
+        header=header,
+        rows=rows,
+        by_constituency={key: tuple(group) for key, group in by_constituency.items()},
+        official_by_key=official_by_key,
+        columns=columns,
+        value_indices={
+            **{name: _value_indices(columns[name]) for name in INDEXED_COLUMNS},
+            **range_value_indices(columns, len(rows)),
+        },
+    )
+
+
+def _title_case(value: str) -> str:
+    return value.strip().title()
+
+
+def _pad_row(values: list[str], width: int) -> tuple[str, ...]:
+    # Trim stray extra fields, pad short rows, and keep one trailing "" that
+    # the row fields getter reads for columns the header lacks.
+    if len(values) == width:
+        # The common case: a well-formed row only needs the trailing "".
+        values.append("")
+        return tuple(values)
+    values = values[:width]
+    values += [""] * (width + 1 - len(values))
+    return tuple(values)
+
+
+def _dataset_columns(rows: tuple[CandidateRow, ...]) -> dict[str, tuple]:
+    columns = {name: tuple(map(attrgetter(name), rows)) for name in DATASET_COLUMNS}
+    for name in NUMERIC_DATASET_COLUMNS:
+        columns[name] = tuple(math.nan if value is None else value for value in columns[name])
+    return columns
+
+
+def _value_indices(values: tuple) -> dict[object, tuple[int, ...]]:
+    positions: dict[object, list[int]] = defaultdict(list)
+    for index, value in enumerate(values):
+        positions[value].append(index)
+    return {value: tuple(indices) for value, indices in positions.items()}
 
 
 @lru_cache(maxsize=4)
-def _load_party_rows(csv_path: str) -> list[dict]:
-    path = Path(csv_path)
-    if not path.exists():
-        return []
-    with path.open("r", encoding="utf-8") as handle:
-        return list(csv.DictReader(handle))
+def _dataset_overview_stats(dataset: CandidateDataset) -> dict:
+    """Return the unfiltered overview statistics, computed once per dataset."""
+    return _compute_overview_stats(dataset, range(len(dataset.rows)))
 
 
-def _compute_overview_stats(rows: list[dict]) -> dict:
-    """Compute overview statistics from candidate rows."""
-    if not rows:
+def _column_mean(column: tuple, indices: Sequence[int], digits: int) -> Optional[float]:
+    # Missing numbers are NaN in the dataset columns; NaN != NaN drops them.
+    values = [value for value in map(column.__getitem__, indices) if value == value]
+    return round(sum(values) / len(values), digits) if values else None
+
+
+def _compute_overview_stats(dataset: CandidateDataset, indices: Sequence[int]) -> dict:
+    """Compute overview statistics over the dataset rows at ``indices``."""
+    if not indices:
         return {
             "total_parties": 0,
             "total_candidates": 0,
@@ -1202,199 +1724,125 @@ def _compute_overview_stats(rows: list[dict]) -> dict:
             "overall_avg_liabilities": None,
         }
 
-    party_set = set()
-    cases_total = 0
-    cases_count = 0
-    age_total = 0
-    age_count = 0
-    assets_total = 0
-    assets_count = 0
-    liabilities_total = 0
-    liabilities_count = 0
-
-    for row in rows:
-        party_name = (row.get("party") or "").strip() or "Independent / Unknown"
-        party_set.add(party_name)
-
-        cases_value = _parse_int(row.get("criminal_cases"))
-        age_value = _parse_int(row.get("age"))
-        assets_value = _parse_int(row.get("total_assets_rs"))
-        liabilities_value = _parse_int(row.get("liabilities_rs"))
-
-        if cases_value is not None:
-            cases_total += cases_value
-            cases_count += 1
-        if age_value is not None:
-            age_total += age_value
-            age_count += 1
-        if assets_value is not None:
-            assets_total += assets_value
-            assets_count += 1
-        if liabilities_value is not None:
-            liabilities_total += liabilities_value
-            liabilities_count += 1
-
+    columns = dataset.columns
+    parties = set(map(columns["party"].__getitem__, indices))
     return {
-        "total_parties": len(party_set),
-        "total_candidates": len(rows),
-        "overall_avg_cases": round(cases_total / cases_count, 2) if cases_count else None,
-        "overall_avg_age": round(age_total / age_count, 1) if age_count else None,
-        "overall_avg_assets": round(assets_total / assets_count, 0) if assets_count else None,
-        "overall_avg_liabilities": round(liabilities_total / liabilities_count, 0) if liabilities_count else None,
+        "total_parties": len({party or "Independent / Unknown" for party in parties}),
+        "total_candidates": len(indices),
+        "overall_avg_cases": _column_mean(columns["criminal_cases"], indices, 2),
+        "overall_avg_age": _column_mean(columns["age"], indices, 1),
+        "overall_avg_assets": _column_mean(columns["total_assets"], indices, 0),
+        "overall_avg_liabilities": _column_mean(columns["liabilities"], indices, 0),
     }
 
 
-# ---------- Categorical bucket definitions ----------
-CASES_BUCKETS = {"0": (0, 0), "1-5": (1, 5), "6+": (6, None)}
-AGE_BUCKETS = {"under35": (None, 34), "35-44": (35, 44), "45-54": (45, 54), "55+": (55, None)}
-ASSETS_BUCKETS = {
-    "under10l": (None, 999999),
-    "10l-1cr": (1000000, 9999999),
-    "1cr-10cr": (10000000, 99999999),
-    "10cr+": (100000000, None),
-}
+@lru_cache(maxsize=512)
+def _filtered_indices(dataset: CandidateDataset, candidate_filters: CandidateFilters) -> tuple[int, ...]:
+    """Return the positions of the dataset rows passing the filters, once per dataset and filter set."""
+    has_sitting = bool(dataset.rows and "sitting_MLA" in dataset.header)
+    return tuple(
+        select_candidate_indices(
+            len(dataset.rows),
+            dataset.columns,
+            candidate_filters,
+            has_sitting,
+            value_indices=dataset.value_indices,
+        )
+    )
 
 
-def _bucket_range(bucket_value: str, buckets: dict) -> tuple:
-    """Return (min_val, max_val) for a categorical bucket value, or (None, None) if not found."""
-    return buckets.get(bucket_value, (None, None))
+@lru_cache(maxsize=512)
+def _filtered_rows(dataset: CandidateDataset, candidate_filters: CandidateFilters) -> tuple[CandidateRow, ...]:
+    """Return the dataset rows passing the filters, computed once per dataset and filter set."""
+    return tuple(map(dataset.rows.__getitem__, _filtered_indices(dataset, candidate_filters)))
 
 
-def _passes_bucket_filter(value, bucket_min, bucket_max) -> bool:
-    """Check if a numeric value passes a bucket filter range."""
-    if value is None:
-        return False
-    if bucket_min is not None and value < bucket_min:
-        return False
-    if bucket_max is not None and value > bucket_max:
-        return False
-    return True
+def _indices_by_party(dataset: CandidateDataset, filtered_indices: Sequence[int]) -> dict[str, Sequence[int]]:
+    """Group the filtered row positions by party, parties in order of first appearance.
 
+    When no filter narrowed the rows, the groups are the party column's
+    posting lists from ``value_indices``, with blank parties folded into the
+    unknown bucket, so the common unfiltered view skips the per-row grouping.
+    """
+    if len(filtered_indices) == len(dataset.rows):
+        indices_by_party: dict[str, Sequence[int]] = {}
+        for party, positions in dataset.value_indices.get("party", EMPTY_MAPPING).items():
+            label = party or "Independent / Unknown"
+            if label in indices_by_party:
+                indices_by_party[label] = sorted((*indices_by_party[label], *positions))
+            else:
+                indices_by_party[label] = positions
+        return dict(sorted(indices_by_party.items(), key=lambda item: item[1][0]))
 
-def party_dashboard(request):
-    year = request.GET.get("year", "2021").strip()
-    if year not in {"2021", "2026"}:
-        year = "2021"
-    cases_filter = request.GET.get("cases", "").strip()
-    age_group_filter = request.GET.get("age_group", "").strip()
-    assets_range_filter = request.GET.get("assets_range", "").strip()
-    sitting_filter = request.GET.get("sitting_mla", "").strip()
-    district_filter = request.GET.get("district", "").strip()
-    constituency_filter = request.GET.get("constituency", "").strip()
-    selected_party = request.GET.get("party", "").strip()
-    sort_key = request.GET.get("sort", "candidate_count")  # kept for backwards-compat URLs
-    sort_order = request.GET.get("order", "desc")
+    grouped: dict[str, list[int]] = defaultdict(list)
+    party_column = dataset.columns["party"]
+    for index in filtered_indices:
+        grouped[party_column[index] or "Independent / Unknown"].append(index)
+    return grouped
 
-    cases_min, cases_max = _bucket_range(cases_filter, CASES_BUCKETS)
-    age_min, age_max = _bucket_range(age_group_filter, AGE_BUCKETS)
-    assets_min, assets_max = _bucket_range(assets_range_filter, ASSETS_BUCKETS)
-    cases_filter_active = cases_filter in CASES_BUCKETS
-    age_filter_active = age_group_filter in AGE_BUCKETS
-    assets_filter_active = assets_range_filter in ASSETS_BUCKETS
 
-    data_dir = settings.BASE_DIR.parent / "data"
-    csv_path = data_dir / ("tn_2026_candidates.csv" if year == "2026" else "fct_candidates_21.csv")
-    rows = _load_party_rows(str(csv_path))
-    has_sitting = bool(rows and "sitting_MLA" in rows[0])
-
-    filtered_rows: list[dict] = []
-    party_set = set()
-    district_set = set()
-    district_map: dict[str, set[str]] = defaultdict(set)
-    district_key = ("2021_district", "district")
-    constituency_key = ("2021_constituency", "constituency")
-    for row in rows:
-        cases_value = _parse_int(row.get("criminal_cases"))
-        age_value = _parse_int(row.get("age"))
-        assets_value = _parse_int(row.get("total_assets_rs"))
-        sitting_value = _parse_int(row.get("sitting_MLA"))
-        party_name = (row.get("party") or "").strip() or "Independent / Unknown"
-        district_name = _row_value(row, district_key)
-        constituency_name = _row_value(row, constituency_key)
-        party_set.add(party_name)
-        if district_name:
-            district_set.add(district_name)
-            if constituency_name:
-                district_map[district_name].add(constituency_name)
-        if cases_filter_active and not _passes_bucket_filter(cases_value, cases_min, cases_max):
-            continue
-        if age_filter_active and not _passes_bucket_filter(age_value, age_min, age_max):
-            continue
-        if assets_filter_active and not _passes_bucket_filter(assets_value, assets_min, assets_max):
-            continue
-        if has_sitting and sitting_filter in {"0", "1"}:
-            if sitting_value is None or str(sitting_value) != sitting_filter:
-                continue
-        if selected_party and party_name != selected_party:
-            continue
-        if district_filter and district_name != district_filter:
-            continue
-        if constituency_filter and constituency_name != constituency_filter:
-            continue
-        filtered_rows.append(row)
-
-    party_data: dict[str, dict] = defaultdict(lambda: {
-        "count": 0,
-        "cases_total": 0,
-        "cases_count": 0,
-        "cases_positive": 0,
-        "age_total": 0,
-        "age_count": 0,
-        "assets_total": 0,
-        "assets_count": 0,
-        "sitting_total": 0,
-        "education_counts": Counter(),
-    })
+@dataclass(frozen=True, slots=True)
+class PartyDashboardStats:
+    party_stats: tuple[dict, ...]
+    parties_with_sitting: frozenset[str]
+    overview: dict
+
 
+@lru_cache(maxsize=256)
+def _party_dashboard_stats(dataset: CandidateDataset, candidate_filters: CandidateFilters) -> PartyDashboardStats:
+    """Aggregate the dashboard's per-party statistics for one filter combination.
+
+    Results are memoized per dataset instance; a changed CSV is parsed into a
+    new dataset, so stale aggregates are never served.
+    """
+    filtered_indices = _filtered_indices(dataset, candidate_filters)
+    columns = dataset.columns
+
+    # Group row positions once, then reduce each party's slice of the dataset
+    # columns; missing numbers are NaN there, and NaN != NaN drops them.
+    indices_by_party = _indices_by_party(dataset, filtered_indices)
+
+    cases_column = columns["criminal_cases"]
+    age_column = columns["age"]
+    assets_column = columns["total_assets"]
+    sitting_column = columns["sitting"]
+    liabilities_column = columns["liabilities"]
+    education_column = columns["education"]
+    # The overview totals are summed from each party's slice in the same pass,
+    # rather than rescanning the filtered rows afterwards.
+    cases_total = cases_count = age_total = age_count = 0
+    assets_total = assets_count = liabilities_total = liabilities_count = 0
     parties_with_sitting: set[str] = set()
-    for row in filtered_rows:
-        party = (row.get("party") or "").strip() or "Independent / Unknown"
-        cases_value = _parse_int(row.get("criminal_cases"))
-        age_value = _parse_int(row.get("age"))
-        education_value = (row.get("education") or "").strip()
-        assets_value = _parse_int(row.get("total_assets_rs"))
-        sitting_value = _parse_int(row.get("sitting_MLA"))
-
-        bucket = party_data[party]
-        bucket["count"] += 1
-        if cases_value is not None:
-            bucket["cases_total"] += cases_value
-            bucket["cases_count"] += 1
-            if cases_value > 0:
-                bucket["cases_positive"] += 1
-        if age_value is not None:
-            bucket["age_total"] += age_value
-            bucket["age_count"] += 1
-        if assets_value is not None:
-            bucket["assets_total"] += assets_value
-            bucket["assets_count"] += 1
-        if sitting_value is not None and sitting_value > 0:
-            bucket["sitting_total"] += 1
+    party_stats = []
+    for party, indices in indices_by_party.items():
+        count = len(indices)
+        cases_values = [value for value in map(cases_column.__getitem__, indices) if value == value]
+        age_values = [value for value in map(age_column.__getitem__, indices) if value == value]
+        assets_values = [value for value in map(assets_column.__getitem__, indices) if value == value]
+        liabilities_values = [value for value in map(liabilities_column.__getitem__, indices) if value == value]
+        cases_total += sum(cases_values)
+        cases_count += len(cases_values)
+        age_total += sum(age_values)
+        age_count += len(age_values)
+        assets_total += sum(assets_values)
+        assets_count += len(assets_values)
+        liabilities_total += sum(liabilities_values)
+        liabilities_count += len(liabilities_values)
+        if any(value > 0 for value in map(sitting_column.__getitem__, indices)):
             parties_with_sitting.add(party)
-        if education_value:
-            bucket["education_counts"][education_value] += 1
 
-    party_stats = []
-    for party, stats in party_data.items():
-        avg_cases = (
-            round(stats["cases_total"] / stats["cases_count"], 2)
-            if stats["cases_count"]
-            else None
-        )
-        avg_age = round(stats["age_total"] / stats["age_count"], 1) if stats["age_count"] else None
-        avg_assets = (
-            round(stats["assets_total"] / stats["assets_count"], 0)
-            if stats["assets_count"]
-            else None
-        )
-        cases_pct = round((stats["cases_positive"] / stats["count"]) * 100, 1) if stats["count"] else 0.0
-        top_education = stats["education_counts"].most_common(1)
+        avg_cases = round(sum(cases_values) / len(cases_values), 2) if cases_values else None
+        avg_age = round(sum(age_values) / len(age_values), 1) if age_values else None
+        avg_assets = round(sum(assets_values) / len(assets_values), 0) if assets_values else None
+        cases_positive = sum(1 for value in cases_values if value > 0)
+        cases_pct = round((cases_positive / count) * 100, 1) if count else 0.0
+        top_education = Counter(filter(None, map(education_column.__getitem__, indices))).most_common(1)
         party_stats.append(
             {
                 "party": party,
                 "party_display": _display_party_name(party),
                 "party_symbol": _party_symbol_url(party),
-                "candidate_count": stats["count"],
+                "candidate_count": count,
                 "avg_cases": avg_cases,
                 "avg_age": avg_age,
                 "avg_assets": avg_assets,
@@ -1403,17 +1851,39 @@ def party_dashboard(request):
             }
         )
 
-    sort_map = {
-        "party": "party",
-        "candidate_count": "candidate_count",
-        "avg_cases": "avg_cases",
-        "cases_pct": "cases_pct",
-        "avg_age": "avg_age",
-        "avg_assets": "avg_assets",
-        "top_education": "top_education",
-    }
-    sort_field = sort_map.get(sort_key, "candidate_count")
-    reverse_sort = sort_order != "asc"
+    return PartyDashboardStats(
+        party_stats=tuple(party_stats),
+        parties_with_sitting=frozenset(parties_with_sitting),
+        overview={
+            "total_parties": len(indices_by_party),
+            "total_candidates": len(filtered_indices),
+            "overall_avg_cases": round(cases_total / cases_count, 2) if cases_count else None,
+            "overall_avg_age": round(age_total / age_count, 1) if age_count else None,
+            "overall_avg_assets": round(assets_total / assets_count, 0) if assets_count else None,
+            "overall_avg_liabilities": round(liabilities_total / liabilities_count, 0) if liabilities_count else None,
+        },
+    )
+
+
+@lru_cache(maxsize=4)
+def _party_labels(dataset: CandidateDataset) -> tuple[tuple[str, str], ...]:
+    """Return ``(party, display label)`` pairs for the party dropdown, sorted by label."""
+    parties = {row.party or "Independent / Unknown" for row in dataset.rows}
+    return tuple(sorted(((party, _display_party_name(party)) for party in parties), key=lambda item: item[1].lower()))
+
+
+PARTY_DASHBOARD_SORT_FIELDS = frozenset(
+    {"party", "candidate_count", "avg_cases", "cases_pct", "avg_age", "avg_assets", "top_education"}
+)
+
+
+# Party stat fields that always hold a number, so they sort on the raw value.
+NUMERIC_PARTY_SORT_FIELDS = frozenset({"candidate_count", "cases_pct"})
+
+
+def _party_stat_sort_key(sort_field: str) -> Callable[[dict], object]:
+    if sort_field in NUMERIC_PARTY_SORT_FIELDS:
+        return itemgetter(sort_field)
 
     def _sort_value(item: dict):
         value = item.get(sort_field)
@@ -1421,9 +1891,58 @@ def party_dashboard(request):
             return value.lower()
         return value if value is not None else -1
 
-    party_stats.sort(key=_sort_value, reverse=reverse_sort)
+    return _sort_value
+
 
-    overview = _compute_overview_stats(filtered_rows)
+def party_dashboard(request):
+    year = request.GET.get("year", "2021").strip()
+    if year not in {"2021", "2026"}:
+        year = "2021"
+    candidate_filters = CandidateFilters.from_query(request.GET)
+    sort_key = request.GET.get("sort", "candidate_count")  # kept for backwards-compat URLs
+    sort_field = sort_key if sort_key in PARTY_DASHBOARD_SORT_FIELDS else "candidate_count"
+    reverse_sort = request.GET.get("order", "desc") != "asc"
+
+    data_dir = settings.BASE_DIR.parent / "data"
+    csv_path = data_dir / ("tn_2026_candidates.csv" if year == "2026" else "fct_candidates_21.csv")
+    dataset = _load_dataset(str(csv_path))
+    context = _party_dashboard_context(year, str(csv_path), dataset, candidate_filters, sort_field, reverse_sort)
+    # Copied so nothing a template sets can leak into the cached context.
+    return render(request, "core/party_dashboard.html", dict(context))
+
+
+@lru_cache(maxsize=256)
+def _party_dashboard_context(
+    year: str,
+    csv_path: str,
+    dataset: CandidateDataset,
+    candidate_filters: CandidateFilters,
+    sort_field: str,
+    reverse_sort: bool,
+) -> dict:
+    """Build the dashboard's template context, once per dataset, filter set and sort.
+
+    The context is a pure function of these arguments, and a refreshed CSV is
+    parsed into a new dataset, so a changed file never hits a stale entry.
+    """
+    cases_filter = candidate_filters.cases
+    age_group_filter = candidate_filters.age_group
+    assets_range_filter = candidate_filters.assets_range
+    sitting_filter = candidate_filters.sitting_mla
+    district_filter = candidate_filters.district
+    constituency_filter = candidate_filters.constituency
+    selected_party = candidate_filters.party
+    rows = dataset.rows
+    has_sitting = bool(rows and "sitting_MLA" in dataset.header)
+
+    district_index = _dataset_district_index(dataset)
+
+    # The stats are shared by every query that selects the same rows.
+    stats = _party_dashboard_stats(dataset, candidate_filters.normalized())
+
+    party_stats = tuple(sorted(stats.party_stats, key=_party_stat_sort_key(sort_field), reverse=reverse_sort))
+
+    overview = stats.overview
     total_candidates = overview["total_candidates"]
     total_parties = overview["total_parties"]
     overall_avg_cases = overview["overall_avg_cases"]
@@ -1431,9 +1950,10 @@ def party_dashboard(request):
     overall_avg_assets = overview["overall_avg_assets"]
     overall_avg_liabilities = overview["overall_avg_liabilities"]
 
-    available_constituencies = sorted(district_map.get(district_filter, set())) if district_filter else sorted(
-        {const for consts in district_map.values() for const in consts}
-    )
+    if district_filter:
+        available_constituencies = district_index.constituencies_by_district.get(district_filter, ())
+    else:
+        available_constituencies = district_index.all_constituencies
 
     base_query = {
         "year": year,
@@ -1447,186 +1967,233 @@ def party_dashboard(request):
     }
     base_query_no_party = dict(base_query)
     base_query_no_party.pop("party", None)
-    prominent_set = parties_with_sitting | PROMINENT_PARTIES
-    party_options = sorted(
-        [
-            {
-                "value": party,
-                "label": _display_party_name(party),
-                "is_prominent": party in prominent_set,
-            }
-            for party in party_set
-        ],
-        key=lambda item: item["label"].lower(),
+    prominent_set = stats.parties_with_sitting | PROMINENT_PARTIES
+    party_options = tuple(
+        {"value": party, "label": label, "is_prominent": party in prominent_set}
+        for party, label in _party_labels(dataset)
     )
-    return render(
-        request,
-        "core/party_dashboard.html",
+    return {
+        "year": year,
+        "csv_path": csv_path,
+        "total_candidates": total_candidates,
+        "total_parties": total_parties,
+        "overall_avg_cases": overall_avg_cases,
+        "overall_avg_age": overall_avg_age,
+        "overall_avg_assets": overall_avg_assets,
+        "overall_avg_liabilities": overall_avg_liabilities,
+        "party_stats": party_stats,
+        "selected_cases": cases_filter,
+        "selected_age_group": age_group_filter,
+        "selected_assets_range": assets_range_filter,
+        "sitting_mla": sitting_filter if has_sitting else "",
+        "rows_count": total_candidates,
+        "party_options": party_options,
+        "selected_party": selected_party,
+        "districts": district_index.districts,
+        "selected_district": district_filter,
+        "constituencies": available_constituencies,
+        "selected_constituency": constituency_filter,
+        "base_query": urlencode(base_query, doseq=True),
+        "base_query_no_party": urlencode(base_query_no_party, doseq=True),
+    }
+
+
+PARTY_TABLE_EXCLUDED_HEADERS = frozenset({"party", "sitting_MLA", "bye_election", "total_assets", "liabilities", "const_off"})
+PARTY_TABLE_LABELS = {
+    "total_assets_rs": "Total Assets (₹)",
+    "liabilities_rs": "Total Liabilities (₹)",
+    "criminal_cases": "Criminal cases",
+    "2021_constituency": "Constituency",
+    "2021_district": "District",
+    "myneta_url": "More Info",
+}
+PARTY_TABLE_NON_SORTABLE = frozenset({"candidate", "2021_constituency", "2021_district", "myneta_url"})
+PARTY_TABLE_CURRENCY_COLUMNS = frozenset({"total_assets_rs", "liabilities_rs"})
+PARTY_TABLE_NUMBER_COLUMNS = PARTY_TABLE_CURRENCY_COLUMNS | {"criminal_cases", "age"}
+
+
+@lru_cache(maxsize=8)
+def _party_table_columns(header: tuple[str, ...]) -> tuple[dict, ...]:
+    """Return the party detail table's column descriptors for a CSV header, built once per schema."""
+    return tuple(
         {
-            "year": year,
-            "csv_path": csv_path,
-            "total_candidates": total_candidates,
-            "total_parties": total_parties,
-            "overall_avg_cases": overall_avg_cases,
-            "overall_avg_age": overall_avg_age,
-            "overall_avg_assets": overall_avg_assets,
-            "overall_avg_liabilities": overall_avg_liabilities,
-            "party_stats": party_stats,
-            "selected_cases": cases_filter,
-            "selected_age_group": age_group_filter,
-            "selected_assets_range": assets_range_filter,
-            "sitting_mla": sitting_filter if has_sitting else "",
-            "rows_count": len(filtered_rows),
-            "party_options": party_options,
-            "selected_party": selected_party,
-            "districts": sorted(district_set),
-            "selected_district": district_filter,
-            "constituencies": available_constituencies,
-            "selected_constituency": constituency_filter,
-            "base_query": urlencode(base_query, doseq=True),
-            "base_query_no_party": urlencode(base_query_no_party, doseq=True),
+            "key": name,
+            "label": PARTY_TABLE_LABELS.get(name, name.replace("_", " ").title()),
+            "is_currency": name in PARTY_TABLE_CURRENCY_COLUMNS,
+            "is_number": name in PARTY_TABLE_NUMBER_COLUMNS,
+            "is_sortable": name not in PARTY_TABLE_NON_SORTABLE,
+        }
+        for name in header
+        if name not in PARTY_TABLE_EXCLUDED_HEADERS
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class DistrictIndex:
+    districts: tuple[str, ...]
+    constituencies_by_district: dict[str, tuple[str, ...]]
+    all_constituencies: tuple[str, ...]
+
+
+def _district_index(rows: Iterable[CandidateRow]) -> DistrictIndex:
+    """Index the sorted districts and constituencies the filter dropdowns list."""
+    constituencies_by_district: dict[str, set[str]] = defaultdict(set)
+    for row in rows:
+        if row.district:
+            constituencies = constituencies_by_district[row.district]
+            if row.constituency:
+                constituencies.add(row.constituency)
+    return DistrictIndex(
+        districts=tuple(sorted(constituencies_by_district)),
+        constituencies_by_district={
+            district: tuple(sorted(constituencies))
+            for district, constituencies in constituencies_by_district.items()
+            if constituencies
         },
+        all_constituencies=tuple(sorted(set().union(*constituencies_by_district.values()))),
+    )
+
+
+@lru_cache(maxsize=4)
+def _dataset_district_index(dataset: CandidateDataset) -> DistrictIndex:
+    return _district_index(dataset.rows)
+
+
+@dataclass(frozen=True, slots=True)
+class PartyView:
+    """Everything on the party detail page that does not depend on the filters."""
+
+    display_name: str
+    symbol_url: Optional[str]
+    has_sitting: bool
+    table_columns: tuple[dict, ...]
+    district_index: DistrictIndex
+
+
+@lru_cache(maxsize=256)
+def _party_view(dataset: CandidateDataset, party_name: str) -> PartyView:
+    """Build a party's filter-independent page data once per dataset."""
+    return PartyView(
+        display_name=_display_party_name(party_name),
+        symbol_url=_party_symbol_url(party_name),
+        has_sitting=bool(dataset.rows and "sitting_MLA" in dataset.header),
+        table_columns=_party_table_columns(dataset.header if dataset.rows else ()),
+        district_index=_district_index(_filtered_rows(dataset, CandidateFilters(party=party_name))),
     )
 
 
+# Every lru_cache keyed on a CandidateDataset, cleared by _load_dataset
+# whenever it parses a new dataset. Their sizes are set for the distinct
+# filter sets and names of one dataset, so without clearing, a replaced
+# dataset would stay alive until hundreds of newer entries pushed it out.
+DATASET_CACHES = (
+    _map_constituency_key,
+    _detail_constituency_key,
+    _sitting_index,
+    _constituency_summary_values,
+    _dataset_overview_stats,
+    _filtered_indices,
+    _filtered_rows,
+    _party_dashboard_stats,
+    _party_labels,
+    _party_dashboard_context,
+    _dataset_district_index,
+    _party_view,
+)
+
+
+# Party detail pages are pure functions of the CSV, the URL and the session
+# language, so the rendered body is cached under a key holding all three. The
+# party record shown on the page is read from the database, and like
+# _party_lookups it may lag behind an edit by up to the timeout.
+PARTY_DETAIL_CACHE_SECONDS = 10 * 60
+
+
+def _party_detail_cache_key(request, csv_path: Path) -> str:
+    try:
+        csv_mtime = csv_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        csv_mtime = 0
+    language = request.session.get("language", "en")
+    # The absolute URL covers the query string and the host the page links to.
+    url_digest = hashlib.md5(request.build_absolute_uri().encode("utf-8"), usedforsecurity=False).hexdigest()
+    return f"core:party_detail:{csv_mtime}:{language}:{url_digest}"
+
+
 def party_detail(request, party_name: str):
     year = request.GET.get("year", "2021").strip()
     if year not in {"2021", "2026"}:
         year = "2021"
-    party_display_name = _display_party_name(party_name)
-    party_symbol = _party_symbol_url(party_name)
-    cases_filter = request.GET.get("cases", "").strip()
-    age_group_filter = request.GET.get("age_group", "").strip()
-    assets_range_filter = request.GET.get("assets_range", "").strip()
-    sitting_filter = request.GET.get("sitting_mla", "").strip()
-    district_filter = request.GET.get("district", "").strip()
-    constituency_filter = request.GET.get("constituency", "").strip()
-
-    cases_min, cases_max = _bucket_range(cases_filter, CASES_BUCKETS)
-    age_min, age_max = _bucket_range(age_group_filter, AGE_BUCKETS)
-    assets_min, assets_max = _bucket_range(assets_range_filter, ASSETS_BUCKETS)
-    cases_filter_active = cases_filter in CASES_BUCKETS
-    age_filter_active = age_group_filter in AGE_BUCKETS
-    assets_filter_active = assets_range_filter in ASSETS_BUCKETS
+    # The party comes from the URL; a stray ?party= must not override it.
+    candidate_filters = replace(CandidateFilters.from_query(request.GET), party=party_name)
+    cases_filter = candidate_filters.cases
+    age_group_filter = candidate_filters.age_group
+    assets_range_filter = candidate_filters.assets_range
+    sitting_filter = candidate_filters.sitting_mla
+    district_filter = candidate_filters.district
+    constituency_filter = candidate_filters.constituency
 
     data_dir = settings.BASE_DIR.parent / "data"
     csv_path = data_dir / ("tn_2026_candidates.csv" if year == "2026" else "fct_candidates_21.csv")
-    rows = _load_party_rows(str(csv_path))
+    cache_key = _party_detail_cache_key(request, csv_path)
+    body = cache.get(cache_key)
+    if body is not None:
+        return HttpResponse(body)
+    dataset = _load_dataset(str(csv_path))
+    party_view = _party_view(dataset, party_name)
+    district_index = party_view.district_index
 
-    has_sitting = bool(rows and "sitting_MLA" in rows[0])
-    district_key = ("2021_district", "district")
-    constituency_key = ("2021_constituency", "constituency")
-    district_set = set()
-    district_map: dict[str, set[str]] = defaultdict(set)
-    all_party_rows = []
+    party_rows = _filtered_rows(dataset, candidate_filters.normalized())
 
-    for row in rows:
-        if (row.get("party") or "").strip() != party_name:
-            continue
-        all_party_rows.append(row)
-        district_name = _row_value(row, district_key)
-        constituency_name = _row_value(row, constituency_key)
-        if district_name:
-            district_set.add(district_name)
-            if constituency_name:
-                district_map[district_name].add(constituency_name)
-
-    party_rows = []
-    for row in all_party_rows:
-        cases_value = _parse_int(row.get("criminal_cases"))
-        age_value = _parse_int(row.get("age"))
-        assets_value = _parse_int(row.get("total_assets_rs"))
-        sitting_value = _parse_int(row.get("sitting_MLA"))
-        district_name = _row_value(row, district_key)
-        constituency_name = _row_value(row, constituency_key)
-
-        if cases_filter_active and not _passes_bucket_filter(cases_value, cases_min, cases_max):
-            continue
-        if age_filter_active and not _passes_bucket_filter(age_value, age_min, age_max):
-            continue
-        if assets_filter_active and not _passes_bucket_filter(assets_value, assets_min, assets_max):
-            continue
-        if has_sitting and sitting_filter in {"0", "1"}:
-            if sitting_value is None or str(sitting_value) != sitting_filter:
-                continue
-        if district_filter and district_name != district_filter:
-            continue
-        if constituency_filter and constituency_name != constituency_filter:
-            continue
-        party_rows.append(row)
-
-    headers = list(rows[0].keys()) if rows else []
-    excluded_headers = {"party", "sitting_MLA", "bye_election", "total_assets", "liabilities", "const_off"}
-    allowed_headers = [header for header in headers if header not in excluded_headers]
-    label_overrides = {
-        "total_assets_rs": "Total Assets (₹)",
-        "liabilities_rs": "Total Liabilities (₹)",
-        "criminal_cases": "Criminal cases",
-        "2021_constituency": "Constituency",
-        "2021_district": "District",
-        "myneta_url": "More Info",
-    }
-    non_sortable = {"candidate", "2021_constituency", "2021_district", "myneta_url"}
-    columns = [
-        {
-            "key": header,
-            "label": label_overrides.get(header, header.replace("_", " ").title()),
-            "is_currency": header in {"total_assets_rs", "liabilities_rs"},
-            "is_number": header in {"criminal_cases", "age", "total_assets_rs", "liabilities_rs"},
-            "is_sortable": header not in non_sortable,
-        }
-        for header in allowed_headers
-    ]
     myneta_key = "myneta_url"
-    constituency_header = None
-    if "2021_constituency" in allowed_headers:
-        constituency_header = "2021_constituency"
-    elif "constituency" in allowed_headers:
-        constituency_header = "constituency"
-    rows_table = []
-    for row in party_rows:
-        row_data = {header: row.get(header, "") for header in allowed_headers}
-        const_off = (row.get("const_off") or "").strip()
-        if constituency_header and const_off:
-            row_data[constituency_header] = const_off
-        for district_header in ("2021_district", "district"):
-            if district_header in row_data and row_data[district_header]:
-                row_data[district_header] = str(row_data[district_header]).strip().title()
-        row_data["is_2016"] = _is_2016_row(row)
-        rows_table.append(row_data)
-    available_constituencies = sorted(district_map.get(district_filter, set())) if district_filter else sorted(
-        {const for consts in district_map.values() for const in consts}
-    )
+    if district_filter:
+        available_constituencies = district_index.constituencies_by_district.get(district_filter, ())
+    else:
+        available_constituencies = district_index.all_constituencies
 
-    party_obj = Party.objects.filter(name=party_name).first() or Party.objects.filter(abbreviation=party_name).first()
+    # One query for both spellings; an exact name match wins over an abbreviation.
+    party_obj = (
+        Party.objects.filter(Q(name=party_name) | Q(abbreviation=party_name))
+        .order_by(Case(When(name=party_name, then=Value(0)), default=Value(1)), "name")
+        .first()
+    )
 
-    return render(
+    response = render(
         request,
         "core/party_detail.html",
         {
             "party_name": party_name,
-            "party_display_name": party_display_name,
-            "party_symbol": party_symbol,
+            "party_display_name": party_view.display_name,
+            "party_symbol": party_view.symbol_url,
             "party_obj": party_obj,
             "year": year,
-            "rows": rows_table,
-            "columns": columns,
+            # Rows render through CandidateRow.get via the get_item filter.
+            "rows": party_rows,
+            "columns": party_view.table_columns,
             "myneta_key": myneta_key,
             "row_count": len(party_rows),
             "selected_cases": cases_filter,
             "selected_age_group": age_group_filter,
             "selected_assets_range": assets_range_filter,
-            "sitting_mla": sitting_filter if has_sitting else "",
-            "districts": sorted(district_set),
+            "sitting_mla": sitting_filter if party_view.has_sitting else "",
+            "districts": district_index.districts,
             "selected_district": district_filter,
             "constituencies": available_constituencies,
             "selected_constituency": constituency_filter,
         },
     )
+    cache.set(cache_key, response.content, PARTY_DETAIL_CACHE_SECONDS)
+    return response
+
+
+# The API serializers never read the pre-serialized boundary text, and a
+# constituency is shared by many candidates and manifestos, so it is
+# prefetched once per page rather than joined onto every row.
+API_CONSTITUENCIES = Constituency.objects.defer("boundary_geojson_text")
 
 
 class ConstituencyViewSet(viewsets.ReadOnlyModelViewSet):
-    queryset = Constituency.objects.all()
+    queryset = API_CONSTITUENCIES
     serializer_class = ConstituencySerializer
     filter_backends = [filters.SearchFilter]
     search_fields = ["name", "district"]
@@ -1640,14 +2207,21 @@ class PartyViewSet(viewsets.ReadOnlyModelViewSet):
 
 
 class CandidateViewSet(viewsets.ReadOnlyModelViewSet):
-    queryset = Candidate.objects.select_related("party", "constituency")
+    queryset = Candidate.objects.select_related("party").prefetch_related(
+        Prefetch("constituency", queryset=API_CONSTITUENCIES)
+    )
     serializer_class = CandidateSerializer
     filter_backends = [filters.SearchFilter]
     search_fields = ["name", "party__name", "constituency__name"]
 
 
 class ManifestoViewSet(viewsets.ReadOnlyModelViewSet):
-    queryset = Manifesto.objects.select_related("party", "constituency", "candidate")
+    # The nested candidate serializer also renders the candidate's party and
+    # constituency, which were previously fetched one query per manifesto.
+    queryset = Manifesto.objects.select_related("party", "candidate__party").prefetch_related(
+        Prefetch("constituency", queryset=API_CONSTITUENCIES),
+        Prefetch("candidate__constituency", queryset=API_CONSTITUENCIES),
+    )
     serializer_class = ManifestoSerializer
     filter_backends = [filters.SearchFilter]
     search_fields = ["party__name", "constituency__name", "candidate__name"]